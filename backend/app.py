@@ -5,6 +5,7 @@ Raspberry Pi 5 with Sense HAT and 7" Touch Screen
 """
 
 from flask import Flask, render_template, jsonify, request, Response, redirect
+from flask.json.provider import DefaultJSONProvider
 import threading
 import time
 import os
@@ -14,10 +15,34 @@ import platform
 import shutil
 import socket
 import json
+import math
+import re
+import queue
+import hashlib
+import heapq
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+# Configure logging once, before any module is imported. Library modules
+# only create loggers; they don't call basicConfig themselves.
+# LOG_LEVEL=DEBUG turns on the per-request media/D-Bus tracing.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    LOG_LEVEL = 'INFO'
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Evaluated once; several request handlers branch on these
+_IS_LINUX = platform.system().lower() == 'linux'
+_MACHINE = platform.machine()
 
 # Suppress ALSA warnings early (before any audio libraries are imported)
 # Note: sys is imported above so it's available here
-if platform.system().lower() == 'linux':
+if _IS_LINUX:
     # Set environment variables to reduce ALSA verbosity
     os.environ.setdefault('ALSA_CARD', '2')  # Use USB audio card if available
     os.environ.setdefault('PULSE_ALSA_HACK_DEVICE', '1')
@@ -35,10 +60,12 @@ if platform.system().lower() == 'linux':
                 'JackShmReadWritePtr', 'Unknown PCM', 'Unable to find definition',
                 'pcm_', 'confmisc', 'conf.c', 'snd_'
             ]
+            # One alternation scans each write once instead of once per pattern
+            self.alsa_re = re.compile('|'.join(map(re.escape, self.alsa_patterns)))
         
         def write(self, text):
             # Only write if it's not an ALSA warning
-            if not any(pattern in text for pattern in self.alsa_patterns):
+            if not self.alsa_re.search(text):
                 self.original_stderr.write(text)
         
         def flush(self):
@@ -52,47 +79,38 @@ if platform.system().lower() == 'linux':
     if not os.environ.get('KEEP_ALSA_ERRORS'):
         sys.stderr = ALSAErrorFilter(sys.stderr)
 
-# =============================================================================
-# Force IPv4 for Safari/iPhone GPS Bridge Compatibility
-# =============================================================================
-# Safari on iOS has issues with geolocation API over IPv6
-# Force all socket operations to use IPv4
-
-# Set environment variable to prefer IPv4
-os.environ["GEVENT_RESOLVER"] = "ares"
-
-# Monkey-patch socket to prefer IPv4
-_original_getaddrinfo = socket.getaddrinfo
-def _ipv4_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
-    """Force IPv4 (AF_INET) for all address lookups"""
-    return _original_getaddrinfo(host, port, socket.AF_INET, type, proto, flags)
-
-# Only apply on Linux (Raspberry Pi) - macOS handles this fine
-if platform.system().lower() == 'linux':
-    socket.getaddrinfo = _ipv4_getaddrinfo
-
 # =============================================================================
 # Runtime IP Detection (for LAN access from iPhone/etc)
 # =============================================================================
 
+# A detected LAN IP is reused for this long. It only changes when the Pi
+# joins another network (e.g. a different phone hotspot).
+RUNTIME_IP_TTL = 300  # seconds
+_runtime_ip_cache = {"ip": None, "ts": 0.0}
+
 def get_runtime_ip():
     """
     Get the LAN IP address for this system.
     Priority: Environment variable > Auto-detect > localhost
+    A detected address is cached for RUNTIME_IP_TTL seconds.
     """
     # Check if set by startup script
     env_ip = os.environ.get("CAR_STEREO_LAN_IP")
     if env_ip and env_ip != "localhost":
         return env_ip
     
+    if _runtime_ip_cache["ip"] and time.monotonic() - _runtime_ip_cache["ts"] < RUNTIME_IP_TTL:
+        return _runtime_ip_cache["ip"]
+    
     # Auto-detect LAN IP
     try:
         # Connect to external address to determine local IP (doesn't actually send data)
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(0.5)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.5)
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+        _runtime_ip_cache["ip"] = ip
+        _runtime_ip_cache["ts"] = time.monotonic()
         return ip
     except Exception:
         pass
@@ -104,14 +122,6 @@ def get_runtime_port():
     """Get the port number for the Flask server."""
     return os.environ.get("CAR_STEREO_PORT", "5000")
 
-# CORS support for iPhone Safari GPS bridge
-try:
-    from flask_cors import CORS
-    CORS_AVAILABLE = True
-except ImportError:
-    CORS_AVAILABLE = False
-    print("Warning: flask-cors not installed. iPhone GPS bridge may not work.")
-
 # =============================================================================
 # Check for optional dependencies and warn if missing
 # =============================================================================
@@ -152,12 +162,37 @@ except ImportError:
     print("Warning: dbus-python is not installed. Native BlueZ media control unavailable.")
     print("  Install with: pip install dbus-python")
 
+# Check for waitress (production WSGI server)
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+    print("Warning: waitress is not installed. Falling back to the Flask development server.")
+    print("  Install with: pip install waitress>=3.0.0")
+
+# Check for orjson (fast JSON encoding for API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Warning: orjson is not installed. API responses will use the stdlib JSON encoder.")
+    print("  Install with: pip install orjson>=3.9.0")
+
+# Check for numpy (vectorized distance math for place search)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("Warning: numpy is not installed. Place distances will be computed one at a time.")
+    print("  Install with: pip install numpy")
+
 # =============================================================================
 # Import application modules
 # =============================================================================
 
-import sys
-import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -179,6 +214,27 @@ except ImportError as e:
     print(f"Warning: Voice control not available: {e}")
     print("  Install with: pip install SpeechRecognition PyAudio")
 
+# Import phone (Bluetooth / iPhone bridge) and Pi (GPS / WiFi / IP) location providers
+try:
+    from backend.modules.phone_location import PhoneLocation
+except ImportError as e:
+    PhoneLocation = None
+    print(f"Warning: Phone location not available: {e}")
+
+try:
+    from backend.modules.location_module import PiLocation
+except ImportError as e:
+    PiLocation = None
+    print(f"Warning: Pi location not available: {e}")
+
+# Google API settings for place search
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config'))
+    from config import GOOGLE_MAPS_API_KEY, USE_GOOGLE_MAPS
+except ImportError:
+    GOOGLE_MAPS_API_KEY = None
+    USE_GOOGLE_MAPS = False
+
 # Import Phone Manager for HFP (Hands-Free Profile)
 try:
     from backend.modules.phone_manager import phone_manager
@@ -194,6 +250,8 @@ try:
         run_bluez_media_command,
         get_bluez_metadata,
         is_bluez_player_available,
+        start_bluez_watch,
+        add_bluez_media_listener,
         DBUS_AVAILABLE as BLUEZ_MEDIA_AVAILABLE
     )
 except ImportError:
@@ -201,6 +259,31 @@ except ImportError:
     run_bluez_media_command = None
     get_bluez_metadata = None
     is_bluez_player_available = None
+    start_bluez_watch = None
+    add_bluez_media_listener = None
+
+# Import in-process MPRIS control (used before falling back to playerctl)
+try:
+    from backend.modules.mpris_media import (
+        run_mpris_command,
+        get_mpris_metadata,
+        start_mpris_watch,
+        add_player_change_listener,
+        add_media_change_listener,
+        toggle_mpris_playback,
+        find_mpris_player,
+        MPRIS_BUS_PREFIX,
+        DBUS_AVAILABLE as MPRIS_AVAILABLE
+    )
+except ImportError:
+    MPRIS_AVAILABLE = False
+    run_mpris_command = None
+    get_mpris_metadata = None
+    start_mpris_watch = None
+    add_player_change_listener = None
+    add_media_change_listener = None
+    toggle_mpris_playback = None
+    find_mpris_player = None
 
 app = Flask(__name__, 
             template_folder=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'frontend', 'templates'),
@@ -208,23 +291,77 @@ app = Flask(__name__,
 # SECURITY: Secret key should be set via environment variable in production
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'PUT_SECRET_KEY_HERE')
 
-# Enable CORS for iPhone Safari GPS bridge
-if CORS_AVAILABLE:
-    CORS(app, resources={r"/api/*": {"origins": "*"}})
+# DEV=1 enables the Flask debugger and template auto-reload. Otherwise templates
+# are compiled once and never re-checked on disk.
+DEV_MODE = bool(os.environ.get('DEV'))
+app.config.update(DEBUG=DEV_MODE, TEMPLATES_AUTO_RELOAD=DEV_MODE)
 
-# Additional CORS headers for Safari GPS compatibility (works even without flask-cors)
-@app.after_request
-def add_safari_cors_headers(response):
+PAGE_TEMPLATES = (
+    'main_menu.html', 'music.html', 'map.html', 'android_auto.html', 'settings.html',
+    'phone.html', 'ios_bridge.html', 'iphone_nav.html', 'navigation.html'
+)
+
+def warm_template_cache():
+    """Load and compile every page template so the first visit to each screen isn't slow."""
+    for name in PAGE_TEMPLATES:
+        app.jinja_env.get_template(name)
+
+# orjson settings shared by jsonify() and encode_json(), so both accept the
+# same payloads: sorted keys like Flask's default, non-str keys allowed, and
+# Flask's fallback (dates, UUIDs, dataclasses...) for types orjson doesn't know
+ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else 0
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson, so jsonify() and request.json skip the
+    pure-Python stdlib encoder. Keys stay sorted to match Flask's default output.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+def encode_json(payload):
+    """Serialize payload to JSON bytes (sorted keys, same as jsonify)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=app.json.default, option=ORJSON_OPTIONS)
+    return app.json.dumps(payload).encode()
+
+def decode_json(body):
+    """Parse JSON bytes, e.g. a large upstream API response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def json_response(payload, status=200):
     """
-    Add comprehensive CORS headers for iPhone Safari GPS bridge.
-    Safari requires these headers to allow geolocation API calls from the page.
+    Build a JSON Response from encode_json() bytes. Used on the hot media
+    endpoints instead of jsonify(), skipping the provider's str round-trip.
     """
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS, PUT, DELETE"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Accept, Authorization"
-    response.headers["Access-Control-Max-Age"] = "3600"
+    return Response(encode_json(payload), status=status, mimetype='application/json')
+
+# CORS headers for the iPhone Safari GPS bridge, which calls /api/* from the
+# phone. Flask answers OPTIONS preflights for every route on its own, so these
+# headers are all that's needed.
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS, PUT, DELETE",
+    "Access-Control-Allow-Headers": "Content-Type, Accept, Authorization",
+    "Access-Control-Max-Age": "3600",
     # Allow credentials for potential future auth
-    response.headers["Access-Control-Allow-Credentials"] = "false"
+    "Access-Control-Allow-Credentials": "false",
+}
+
+@app.after_request
+def add_safari_cors_headers(response):
+    """Add CORS headers to /api/ responses for the iPhone Safari GPS bridge."""
+    if request.path.startswith('/api/'):
+        response.headers.update(CORS_HEADERS)
     return response
 
 # Initialize managers
@@ -240,22 +377,48 @@ if VOICE_CONTROL_AVAILABLE:
 else:
     voice = None
 
+@dataclass(slots=True)
+class SystemState:
+    """Playback/connection state shared by request threads and the Sense HAT thread."""
+    music_playing: bool = False
+    bluetooth_connected: bool = False
+    current_track: Optional[str] = None
+    volume: int = 50
+
 # Global state
 current_screen = 'main_menu'
-system_state = {
-    'music_playing': False,
-    'bluetooth_connected': False,
-    'current_track': None,
-    'volume': 50
-}
+system_state = SystemState()
+# Hold while reading or writing system_state so readers never see a half-applied update
+_state_lock = threading.RLock()
+
+# Set whenever system_state changes so the Sense HAT thread redraws right away
+state_changed = threading.Event()
+
+def get_system_state():
+    """Return a consistent dict copy of system_state."""
+    with _state_lock:
+        return asdict(system_state)
 
 # Global variable to store navigation URL from iPhone
 current_nav_url = None
 
+# Rendered HTML for the static UI screens. Their only template input is the
+# machine type, so each one is rendered on first visit and reused after that.
+_page_cache = {}
+
+def render_page(template_name):
+    """Render a UI screen once and serve the cached HTML afterwards (uncached with DEV=1)."""
+    html = _page_cache.get(template_name)
+    if html is None:
+        html = render_template(template_name, platform=_MACHINE)
+        if not DEV_MODE:
+            _page_cache[template_name] = html
+    return html
+
 @app.route('/')
 def index():
     """Main menu screen"""
-    return render_template('main_menu.html', platform=platform.machine())
+    return render_page('main_menu.html')
 
 @app.route('/ios_bridge')
 def ios_bridge():
@@ -270,27 +433,27 @@ def ios_bridge():
 @app.route('/music')
 def music_screen():
     """Music player screen"""
-    return render_template('music.html', platform=platform.machine())
+    return render_page('music.html')
 
 @app.route('/map')
 def map_screen():
     """Map navigation screen"""
-    return render_template('map.html', platform=platform.machine())
+    return render_page('map.html')
 
 @app.route('/android_auto')
 def android_auto_screen():
     """Android Auto screen"""
-    return render_template('android_auto.html', platform=platform.machine())
+    return render_page('android_auto.html')
 
 @app.route('/settings')
 def settings_screen():
     """Settings screen"""
-    return render_template('settings.html', platform=platform.machine())
+    return render_page('settings.html')
 
 @app.route('/phone')
 def phone_screen():
     """Phone/Bluetooth Calls screen"""
-    return render_template('phone.html', platform=platform.machine())
+    return render_page('phone.html')
 
 @app.route('/iphone_nav', methods=['GET'])
 def iphone_nav():
@@ -300,53 +463,136 @@ def iphone_nav():
     return render_template('iphone_nav.html')
 
 # API endpoints for system control
+# Latest /api/status payload, rebuilt by the Sense HAT thread so that
+# polling clients never trigger sensor (I2C) reads themselves
+_status_snapshot = {}
+_status_lock = threading.Lock()
+
+def refresh_status_snapshot(read_sensors=True):
+    """
+    Read sensors and connection state into the shared status snapshot.
+    With read_sensors=False the previous sensor readings are kept.
+    """
+    global _status_snapshot
+    state = get_system_state()
+    with _status_lock:
+        previous = _status_snapshot
+    if read_sensors or not previous:
+        sensor_data = sense_hat.get_sensor_data()
+    else:
+        sensor_data = previous['sense_hat_data']
+    snapshot = {
+        'music_playing': state['music_playing'],
+        'bluetooth_connected': bluetooth.is_connected(),
+        'current_track': state['current_track'],
+        'volume': state['volume'],
+        'sense_hat_data': sensor_data
+    }
+    with _status_lock:
+        _status_snapshot = snapshot
+    return snapshot
+
+_HEALTH_BODY = b'{"ok":true}'
+
+@app.route('/healthz')
+def healthz():
+    """Liveness check for proxies and watchdogs; touches no hardware or state."""
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
 @app.route('/api/status')
 def get_status():
     """Get current system status"""
-    return jsonify({
-        'music_playing': system_state['music_playing'],
-        'bluetooth_connected': bluetooth.is_connected(),
-        'current_track': system_state['current_track'],
-        'volume': system_state['volume'],
-        'sense_hat_data': sense_hat.get_sensor_data()
-    })
+    with _status_lock:
+        snapshot = _status_snapshot
+    if not snapshot:
+        # Background thread hasn't produced a snapshot yet
+        snapshot = refresh_status_snapshot()
+    return jsonify(snapshot)
 
 @app.route('/api/music/play', methods=['POST'])
 def play_music():
     """Start music playback"""
     result = music.play()
-    system_state['music_playing'] = result['success']
+    with _state_lock:
+        system_state.music_playing = result['success']
+    state_changed.set()
     return jsonify(result)
 
 @app.route('/api/music/pause', methods=['POST'])
 def pause_music():
     """Pause music playback"""
     result = music.pause()
-    system_state['music_playing'] = False
+    with _state_lock:
+        system_state.music_playing = False
+    state_changed.set()
     return jsonify(result)
 
 @app.route('/api/music/stop', methods=['POST'])
 def stop_music():
     """Stop music playback"""
     result = music.stop()
-    system_state['music_playing'] = False
+    with _state_lock:
+        system_state.music_playing = False
+    state_changed.set()
     return jsonify(result)
 
 @app.route('/api/music/volume', methods=['POST'])
 def set_volume():
     """Set volume level"""
-    data = request.json
-    volume = data.get('volume', 50)
-    volume = max(0, min(100, volume))  # Clamp between 0-100
-    system_state['volume'] = volume
+    data = request.get_json(silent=True) or {}
+    try:
+        volume = max(0, min(100, int(data.get('volume', 50))))  # Clamp between 0-100
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "message": "Invalid volume"}), 400
     result = music.set_volume(volume)
+    if result['success']:
+        with _state_lock:
+            system_state.volume = volume
+        state_changed.set()
     return jsonify(result)
 
+# Last Bluetooth scan result. Scans run in a background thread so a request
+# only blocks when nothing has been scanned yet or a fresh scan is requested.
+BLUETOOTH_SCAN_MAX_AGE = 30  # seconds
+_scan_cache = {"ts": 0.0, "devices": []}
+_scan_lock = threading.Lock()
+_scan_thread = None
+
+def _do_bluetooth_scan():
+    devices = bluetooth.scan_devices()
+    with _scan_lock:
+        _scan_cache["devices"] = devices
+        _scan_cache["ts"] = time.monotonic()
+
+def _start_bluetooth_scan():
+    """Start a background scan unless one is already running; returns its thread."""
+    global _scan_thread
+    with _scan_lock:
+        if _scan_thread is None or not _scan_thread.is_alive():
+            _scan_thread = threading.Thread(target=_do_bluetooth_scan, daemon=True)
+            _scan_thread.start()
+        return _scan_thread
+
 @app.route('/api/bluetooth/scan', methods=['POST'])
 def scan_bluetooth():
-    """Scan for Bluetooth devices"""
-    devices = bluetooth.scan_devices()
-    return jsonify({'devices': devices})
+    """
+    Scan for Bluetooth devices.
+    Returns the last scan result straight away and rescans in the background
+    if it is stale ('scanning': true). Waits for the scan if there is no result
+    yet, or when called with ?refresh=1.
+    """
+    with _scan_lock:
+        scanned_at = _scan_cache["ts"]
+    force = request.args.get('refresh') == '1'
+    scanning = False
+    if force or not scanned_at or time.monotonic() - scanned_at > BLUETOOTH_SCAN_MAX_AGE:
+        scan_thread = _start_bluetooth_scan()
+        if force or not scanned_at:
+            scan_thread.join(timeout=bluetooth.scan_timeout + 10)
+        scanning = scan_thread.is_alive()
+    with _scan_lock:
+        devices = _scan_cache["devices"]
+    return jsonify({'devices': devices, 'scanning': scanning})
 
 @app.route('/api/bluetooth/connect', methods=['POST'])
 def connect_bluetooth():
@@ -354,7 +600,9 @@ def connect_bluetooth():
     data = request.json
     device_address = data.get('address')
     result = bluetooth.connect(device_address)
-    system_state['bluetooth_connected'] = result['success']
+    with _state_lock:
+        system_state.bluetooth_connected = result['success']
+    state_changed.set()
     return jsonify(result)
 
 @app.route('/api/bluetooth/disconnect', methods=['POST'])
@@ -363,7 +611,9 @@ def disconnect_bluetooth():
     data = request.json or {}
     device_address = data.get('address')
     result = bluetooth.disconnect(device_address)
-    system_state['bluetooth_connected'] = False
+    with _state_lock:
+        system_state.bluetooth_connected = False
+    state_changed.set()
     return jsonify(result)
 
 @app.route('/api/bluetooth/status')
@@ -373,187 +623,459 @@ def bluetooth_status():
 
 # =============================================================================
 # Media Control Endpoints
-# Auto-detects: playerctl (preferred) or BlueZ D-Bus AVRCP (fallback)
+# Auto-detects: BlueZ D-Bus AVRCP (preferred), MPRIS over D-Bus, or playerctl (fallback)
 # =============================================================================
 
-import logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-
-# Auto-detect if playerctl is installed
-PLAYERCTL_EXISTS = shutil.which("playerctl") is not None
+# Auto-detect if playerctl is installed. The absolute path is resolved once so
+# each call skips the $PATH search, and is None when there is nothing to run.
+_PLAYERCTL = shutil.which("playerctl") if _IS_LINUX else None
+PLAYERCTL_EXISTS = _PLAYERCTL is not None
 if PLAYERCTL_EXISTS:
-    logging.info("playerctl detected - using as primary media controller")
+    logging.info("playerctl detected - available as fallback media controller")
 else:
-    logging.info("playerctl not found - will use BlueZ AVRCP fallback")
+    logging.info("playerctl not found - using BlueZ AVRCP only")
+
+# playerctl normally answers in tens of milliseconds; a call that takes longer
+# is stuck on D-Bus. subprocess kills the child when the timeout expires.
+PLAYERCTL_TIMEOUT = 1.0  # seconds
+
+# At most this many playerctl processes at once. A request that can't get a
+# slot within PLAYERCTL_TIMEOUT fails instead of queueing up more forks
+# behind a wedged D-Bus.
+PLAYERCTL_MAX_CONCURRENT = 4
+_playerctl_slots = threading.BoundedSemaphore(PLAYERCTL_MAX_CONCURRENT)
+
+# playerctl's "No players found" / "No player could handle this command"
+_NO_PLAYER_RE = re.compile(r'no players?', re.IGNORECASE)
+
+def _run_limited(cmd, **kwargs):
+    """
+    subprocess.run() for playerctl, limited to PLAYERCTL_MAX_CONCURRENT at a
+    time. Waiting for a slot and running share one PLAYERCTL_TIMEOUT budget,
+    so a request thread is never held longer than that.
+    """
+    deadline = time.monotonic() + PLAYERCTL_TIMEOUT
+    if not _playerctl_slots.acquire(timeout=PLAYERCTL_TIMEOUT):
+        raise subprocess.TimeoutExpired(cmd, PLAYERCTL_TIMEOUT)
+    try:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(cmd, PLAYERCTL_TIMEOUT)
+        return subprocess.run(cmd, timeout=remaining, **kwargs)
+    finally:
+        _playerctl_slots.release()
+
+def _run_quiet(cmd):
+    """
+    Run a playerctl control command (play, pause, next...). These print nothing
+    useful, so stdout goes to /dev/null and only stderr is captured.
+    Returns (success, stderr text).
+    """
+    result = _run_limited(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return result.returncode == 0, result.stderr.strip()
 
 def run_media_command(bluez_cmd, playerctl_cmd):
     """
     Run a media command using the best available method:
-    1. playerctl (if installed and working)
-    2. BlueZ D-Bus AVRCP (fallback)
+    1. BlueZ D-Bus AVRCP (in-process, no subprocess per command)
+    2. MPRIS over the D-Bus session bus (in-process)
+    3. playerctl (fallback, if installed)
     
     Args:
-        bluez_cmd: BlueZ MediaPlayer1 method name (e.g., 'Play', 'Pause')
+        bluez_cmd: BlueZ MediaPlayer1 method name (e.g., 'Play', 'Pause'), or
+            'PlayPause'; MPRIS uses the same method names
         playerctl_cmd: playerctl command (e.g., 'play', 'pause')
     
     Returns:
         Tuple of (success: bool, message: str)
     """
     # Check if we're on Linux
-    if platform.system().lower() != 'linux':
+    if not _IS_LINUX:
         return False, "Media controls only available on Raspberry Pi"
     
-    # Try playerctl first if it exists
-    if PLAYERCTL_EXISTS:
-        logging.debug(f"Trying playerctl command: {playerctl_cmd}")
-        try:
-            out = subprocess.check_output(
-                ["playerctl", playerctl_cmd],
-                stderr=subprocess.STDOUT,
-                text=True,
-                timeout=5
-            )
-            return True, out.strip() if out.strip() else "OK"
-        except subprocess.CalledProcessError as e:
-            error_msg = e.output.strip() if e.output else ""
-            # If playerctl says no players, try BlueZ fallback
-            if "no player" in error_msg.lower() or "no players" in error_msg.lower():
-                logging.debug(f"playerctl: {error_msg}, trying BlueZ AVRCP fallback...")
-            else:
-                logging.debug(f"playerctl error: {error_msg}")
-                # Still try BlueZ as fallback
-        except Exception as e:
-            logging.debug(f"playerctl exception: {e}, trying BlueZ fallback...")
-    
-    # Fallback to BlueZ native D-Bus control
+    # Try BlueZ native D-Bus control first
+    bluez_error = None
     if BLUEZ_MEDIA_AVAILABLE and run_bluez_media_command:
-        logging.debug(f"Trying BlueZ D-Bus command: {bluez_cmd}")
+        logging.debug("Trying BlueZ D-Bus command: %s", bluez_cmd)
         ok, msg = run_bluez_media_command(bluez_cmd)
         if ok:
+            invalidate_media_status()
+            return ok, msg
+        bluez_error = msg
+    
+    # Then MPRIS, which reaches the same players playerctl does without a fork.
+    # toggle_mpris_playback covers players that don't implement PlayPause.
+    if MPRIS_AVAILABLE and run_mpris_command:
+        logging.debug("Trying MPRIS command: %s", bluez_cmd)
+        if bluez_cmd == "PlayPause":
+            ok, msg = toggle_mpris_playback()
+        else:
+            ok, msg = run_mpris_command(bluez_cmd)
+        if ok:
+            invalidate_media_status()
             return ok, msg
-        return False, msg
+    
+    # Fall back to playerctl if it exists
+    if PLAYERCTL_EXISTS:
+        logging.debug("Trying playerctl command: %s", playerctl_cmd)
+        try:
+            ok, error_msg = _run_quiet([_PLAYERCTL, playerctl_cmd])
+            if ok:
+                invalidate_media_status()
+                return True, "OK"
+            if _NO_PLAYER_RE.search(error_msg):
+                logging.debug("playerctl: %s", error_msg)
+            else:
+                logging.debug("playerctl error: %s", error_msg)
+        except Exception as e:
+            logging.debug("playerctl exception: %s", e)
     
     # Neither method available
-    if not PLAYERCTL_EXISTS and not BLUEZ_MEDIA_AVAILABLE:
+    if not PLAYERCTL_EXISTS and not BLUEZ_MEDIA_AVAILABLE and not MPRIS_AVAILABLE:
         return False, "No media controller available. Install playerctl or dbus-python."
     
+    if bluez_error:
+        return False, bluez_error
+    
     return False, "No active media player found (is your phone connected?)"
 
+# Cache the active player name so a burst of UI taps reuses one `playerctl -l`.
+# While MPRIS NameOwnerChanged signals are watched, players coming and going
+# invalidate the cache, so it can be kept for longer.
+PLAYER_CACHE_TTL = 5.0  # seconds
+PLAYER_CACHE_TTL_WATCHED = 10.0  # seconds
+_player_cache = {"name": None, "ts": 0.0, "watched": False}
+_player_cache_lock = threading.Lock()
+
+def invalidate_active_player():
+    """Force the next get_active_player() call to query playerctl again."""
+    _player_cache["ts"] = 0.0
+
 def get_active_player():
     """
-    Get the first active media player via playerctl.
+    Get the first active media player, by MPRIS bus name or `playerctl -l`.
     Returns the player name or None if no players are available.
+    The result is cached for PLAYER_CACHE_TTL (or PLAYER_CACHE_TTL_WATCHED) seconds.
     """
-    # Check if we're on Linux
-    if platform.system().lower() != 'linux':
+    ttl = PLAYER_CACHE_TTL_WATCHED if _player_cache["watched"] else PLAYER_CACHE_TTL
+    with _player_cache_lock:
+        now = time.monotonic()
+        if now - _player_cache["ts"] < ttl:
+            return _player_cache["name"]
+        
+        player = _query_active_player()
+        _player_cache["name"] = player
+        _player_cache["ts"] = now
+        return player
+
+def _query_active_player():
+    """
+    Pick the best player (uncached). The MPRIS lookup is the same bus query
+    `playerctl -l` makes, minus the fork; its bus name minus the MPRIS prefix
+    is the name playerctl -p expects.
+    """
+    if not _PLAYERCTL:
         return None
     
+    if MPRIS_AVAILABLE and find_mpris_player:
+        name = find_mpris_player()
+        if name:
+            logging.debug("Active player (MPRIS): %s", name)
+            return name[len(MPRIS_BUS_PREFIX):]
+    
     try:
-        out = subprocess.check_output(
-            ["playerctl", "-l"], 
-            stderr=subprocess.STDOUT, 
-            text=True, 
-            timeout=5
-        ).strip()
+        out = _run_limited(
+            [_PLAYERCTL, "-l"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            check=True
+        ).stdout.strip()
         players = [p for p in out.splitlines() if p]
         if players:
             # Prefer bluez/bluetooth players
             for player in players:
                 if 'bluez' in player.lower() or 'bluetooth' in player.lower():
-                    logging.debug(f"Active player (Bluetooth): {player}")
+                    logging.debug("Active player (Bluetooth): %s", player)
                     return player
             # Fall back to first available player
-            logging.debug(f"Active player: {players[0]}")
+            logging.debug("Active player: %s", players[0])
             return players[0]
         logging.debug("No active players found via playerctl")
         return None
     except subprocess.CalledProcessError as e:
-        logging.debug(f"playerctl -l error: {e.output if e.output else 'No output'}")
+        logging.debug("playerctl -l error: %s", e.output if e.output else 'No output')
         return None
     except FileNotFoundError:
         logging.debug("playerctl not installed")
         return None
     except Exception as e:
-        logging.debug(f"Error getting active player: {e}")
+        logging.debug("Error getting active player: %s", e)
         return None
 
-def run_playerctl_command(command):
-    """
-    Run a playerctl command targeting the active player (fallback method).
-    Returns (success, message).
-    """
-    # Check if we're on Linux
-    if platform.system().lower() != 'linux':
-        return False, "Media controls only available on Raspberry Pi"
-    
-    player = get_active_player()
-    if not player:
-        return False, "No active media player found (is your phone connected and playing?)"
-    
-    try:
-        cmd = ["playerctl", "-p", player, command]
-        logging.debug(f"Running: {' '.join(cmd)}")
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=5)
-        return True, out.strip() if out.strip() else "OK"
-    except subprocess.CalledProcessError as e:
-        error_msg = e.output.strip() if e.output else "Command failed"
-        logging.debug(f"playerctl error: {error_msg}")
-        return False, error_msg
-    except FileNotFoundError:
-        return False, "playerctl not installed"
-    except subprocess.TimeoutExpired:
-        return False, "Command timed out"
-    except Exception as e:
-        return False, str(e)
+def media_command_response(bluez_cmd, playerctl_cmd):
+    """Run a media command (see run_media_command) and build the endpoint's JSON response."""
+    ok, msg = run_media_command(bluez_cmd, playerctl_cmd)
+    return json_response({"ok": ok, "message": msg}, 200 if ok else 500)
 
 @app.route('/api/media/play', methods=['POST'])
 def api_media_play():
     """Send play command to connected media player"""
-    ok, msg = run_media_command("Play", "play")
-    return jsonify({"ok": ok, "message": msg}), (200 if ok else 500)
+    return media_command_response("Play", "play")
 
 @app.route('/api/media/pause', methods=['POST'])
 def api_media_pause():
     """Send pause command to connected media player"""
-    ok, msg = run_media_command("Pause", "pause")
-    return jsonify({"ok": ok, "message": msg}), (200 if ok else 500)
+    return media_command_response("Pause", "pause")
 
 @app.route('/api/media/toggle', methods=['POST'])
 def api_media_toggle():
     """Toggle play/pause on connected media player"""
-    # BlueZ doesn't have a toggle, so we check status and send appropriate command
-    if BLUEZ_MEDIA_AVAILABLE and get_bluez_metadata:
-        metadata = get_bluez_metadata()
-        if metadata:
-            if metadata.get('is_playing'):
-                return api_media_pause()
-            else:
-                return api_media_play()
-    # Fall back to playerctl which has play-pause
-    ok, msg = run_playerctl_command("play-pause")
-    return jsonify({"ok": ok, "message": msg}), (200 if ok else 500)
+    return media_command_response("PlayPause", "play-pause")
 
 @app.route('/api/media/next', methods=['POST'])
 def api_media_next():
     """Skip to next track on connected media player"""
-    ok, msg = run_media_command("Next", "next")
-    return jsonify({"ok": ok, "message": msg}), (200 if ok else 500)
+    return media_command_response("Next", "next")
 
 @app.route('/api/media/previous', methods=['POST'])
 def api_media_previous():
     """Go to previous track on connected media player"""
-    ok, msg = run_media_command("Previous", "previous")
-    return jsonify({"ok": ok, "message": msg}), (200 if ok else 500)
+    return media_command_response("Previous", "previous")
+
+# playerctl template for status + metadata in one call. Fields are joined by
+# U+241F (symbol for unit separator): track titles often contain '|', and
+# control-character separators would be eaten by .strip() on empty fields.
+PLAYERCTL_FIELD_SEP = "\u241f"
+PLAYERCTL_STATUS_FORMAT = PLAYERCTL_FIELD_SEP.join(
+    "{{%s}}" % field for field in ("status", "xesam:artist", "xesam:title", "xesam:album")
+)
+PLAYERCTL_FOLLOW_FORMAT = PLAYERCTL_STATUS_FORMAT + PLAYERCTL_FIELD_SEP + "{{playerName}}"
+# playerctl before 2.0 has no --format (or --follow): status and each metadata
+# field are separate calls, run side by side on these threads
+PLAYERCTL_LEGACY_QUERIES = (("status",), ("metadata", "artist"), ("metadata", "title"), ("metadata", "album"))
+_playerctl_executor = ThreadPoolExecutor(max_workers=PLAYERCTL_MAX_CONCURRENT, thread_name_prefix="playerctl")
+_playerctl_format = {"supported": None}
+
+def playerctl_supports_format():
+    """Whether playerctl understands --format, checked once from `playerctl --help`."""
+    if _playerctl_format["supported"] is None:
+        try:
+            out = _run_limited([_PLAYERCTL, "--help"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True).stdout
+        except Exception as e:
+            # Try again next time rather than remember a guess
+            logging.debug("playerctl --help failed: %s", e)
+            return True
+        _playerctl_format["supported"] = "--format" in out
+        logging.debug("playerctl --format supported: %s", _playerctl_format["supported"])
+    return _playerctl_format["supported"]
+
+NO_PLAYER_STATUS = {
+    "ok": False,
+    "status": "no-player",
+    "message": "No media player connected",
+    "artist": "",
+    "title": "",
+    "album": "",
+    "is_playing": False
+}
+
+# Status pushed by a long-running `playerctl --follow` process (see
+# follow_playerctl). While it runs, /api/media/status doesn't fork at all.
+_media_follow = {"running": False, "snapshot": None}
+_media_follow_lock = threading.Lock()
+
+def _set_media_snapshot(running, snapshot):
+    with _media_follow_lock:
+        changed = _media_follow["running"] != running or _media_follow["snapshot"] != snapshot
+        _media_follow["running"] = running
+        _media_follow["snapshot"] = snapshot
+    if changed:
+        invalidate_media_status()
+
+# Restart delay for the follower doubles each time it dies young (e.g. an old
+# playerctl without --follow, or no session bus), up to the max
+FOLLOW_RESTART_MIN = 5  # seconds
+FOLLOW_RESTART_MAX = 300  # seconds
+# A follower that lived this long resets the restart delay
+FOLLOW_HEALTHY_RUNTIME = 60  # seconds
+
+def follow_playerctl():
+    """
+    Background thread: keep one `playerctl --follow metadata` process running
+    and turn each line it prints into the cached /api/media/status payload.
+    playerctl prints a blank line when the player goes away.
+    """
+    restart_delay = FOLLOW_RESTART_MIN
+    while True:
+        started = time.monotonic()
+        try:
+            proc = subprocess.Popen(
+                [_PLAYERCTL, "--follow", "metadata", "--format", PLAYERCTL_FOLLOW_FORMAT],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            _set_media_snapshot(True, None)
+            for line in iter(proc.stdout.readline, ""):
+                fields = line.rstrip("\n").split(PLAYERCTL_FIELD_SEP)
+                if len(fields) != 5:
+                    _set_media_snapshot(True, None)
+                    continue
+                status, artist, title, album, player = fields
+                _set_media_snapshot(True, {
+                    "ok": True,
+                    "status": status or "Unknown",
+                    "artist": artist,
+                    "title": title,
+                    "album": album,
+                    "is_playing": status.lower() == "playing",
+                    "player": player,
+                    "source": "playerctl"
+                })
+            proc.wait()
+            logging.debug("playerctl follower exited with code %s", proc.returncode)
+        except Exception as e:
+            logging.debug("playerctl follower error: %s", e)
+        # Fall back to per-request playerctl calls until the follower is back
+        _set_media_snapshot(False, None)
+        if time.monotonic() - started >= FOLLOW_HEALTHY_RUNTIME:
+            restart_delay = FOLLOW_RESTART_MIN
+        time.sleep(restart_delay)
+        restart_delay = min(restart_delay * 2, FOLLOW_RESTART_MAX)
+
+# Polls arriving within this window share one lookup (and one ETag)
+MEDIA_STATUS_CACHE_TTL = 0.5  # seconds
+_media_status_cache = {"ts": 0.0, "body": None, "etag": None, "pushed": False, "bluez_watched": False}
+_media_status_lock = threading.Lock()
+
+# /api/media/events clients, one wake-up queue each
+_media_event_queues = set()
+_media_event_lock = threading.Lock()
+# How often an event stream re-checks the status when nothing pushes changes
+# (unwatched BlueZ, per-call playerctl), and the heartbeat interval when
+# something does. Either way a heartbeat goes out on each timeout; a closed
+# EventSource is only noticed on a write, and until then holds one of the
+# SERVER_THREADS, so the heartbeat is kept short.
+MEDIA_EVENTS_POLL_INTERVAL = 2.0  # seconds
+MEDIA_EVENTS_HEARTBEAT = 5.0  # seconds
+
+def invalidate_media_status():
+    """
+    Make the next /api/media/status poll fetch fresh state (after a command or
+    a change signal) and wake the /api/media/events streams to send it.
+    """
+    _media_status_cache["ts"] = 0.0
+    with _media_event_lock:
+        for q in _media_event_queues:
+            try:
+                q.put_nowait(None)
+            except queue.Full:
+                pass  # Already woken
+
+# BlueZ status has a fixed shape, so without orjson it is filled into a
+# template (keys sorted like encode_json) instead of going through the generic
+# encoder. Only the string fields need escaping.
+_BLUEZ_STATUS_KEYS = frozenset(("ok", "status", "artist", "title", "album", "is_playing", "source"))
+_BLUEZ_STATUS_TEMPLATE = (
+    '{"album":%s,"artist":%s,"is_playing":%s,"ok":true,'
+    '"source":"bluez","status":%s,"title":%s}'
+)
+
+def encode_media_status(status):
+    """Serialize a get_media_status() dict to JSON bytes."""
+    if (not ORJSON_AVAILABLE and status.get("source") == "bluez"
+            and status.keys() == _BLUEZ_STATUS_KEYS and status["ok"] is True):
+        fields = (status["album"], status["artist"], status["status"], status["title"])
+        if all(isinstance(field, str) for field in fields):
+            album, artist, state, title = map(json.dumps, fields)
+            is_playing = "true" if status["is_playing"] else "false"
+            return (_BLUEZ_STATUS_TEMPLATE % (album, artist, is_playing, state, title)).encode()
+    return encode_json(status)
+
+def get_media_status_body():
+    """
+    Get the cached /api/media/status JSON body.
+    
+    Returns:
+        Tuple of (body: bytes, etag: str, pushed: bool) where pushed is True
+        if a signal or the playerctl follower will report the next change
+    """
+    with _media_status_lock:
+        if time.monotonic() - _media_status_cache["ts"] >= MEDIA_STATUS_CACHE_TTL:
+            status = get_media_status()
+            source = status.get("source")
+            body = encode_media_status(status)
+            _media_status_cache["body"] = body
+            _media_status_cache["etag"] = hashlib.sha1(body).hexdigest()
+            _media_status_cache["pushed"] = (
+                (source == "bluez" and _media_status_cache["bluez_watched"]) or
+                (source == "mpris" and _player_cache["watched"]) or
+                (source in ("playerctl", None) and _media_follow["running"])
+            )
+            _media_status_cache["ts"] = time.monotonic()
+        return _media_status_cache["body"], _media_status_cache["etag"], _media_status_cache["pushed"]
 
 @app.route('/api/media/status')
 def api_media_status():
-    """Get current playback status from connected media player"""
+    """
+    Get current playback status from connected media player.
+    The JSON body is cached for MEDIA_STATUS_CACHE_TTL seconds and carries a
+    weak ETag, so an unchanged status is answered with 304 Not Modified.
+    """
+    body, etag, _ = get_media_status_body()
+    
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'max-age=1'
+    return response.make_conditional(request)
+
+@app.route('/api/media/events')
+def api_media_events():
+    """
+    Server-Sent Events endpoint for playback status.
+    Sends the status on connect and again whenever it changes, so clients
+    don't have to poll /api/media/status. Client should connect via EventSource.
+    """
+    def generate():
+        q = queue.Queue(maxsize=1)
+        with _media_event_lock:
+            _media_event_queues.add(q)
+        try:
+            last_body = None
+            while True:
+                body, _, pushed = get_media_status_body()
+                if body != last_body:
+                    last_body = body
+                    yield b"data: " + body + b"\n\n"
+                try:
+                    q.get(timeout=MEDIA_EVENTS_HEARTBEAT if pushed else MEDIA_EVENTS_POLL_INTERVAL)
+                except queue.Empty:
+                    # Write something on every timeout, pushed or polling, so a
+                    # closed EventSource raises here and frees its server thread
+                    yield b": heartbeat\n\n"
+        finally:
+            with _media_event_lock:
+                _media_event_queues.discard(q)
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+def get_media_status():
+    """Look up playback status: BlueZ, then MPRIS, then playerctl."""
     
     # Try BlueZ native metadata first
     if BLUEZ_MEDIA_AVAILABLE and get_bluez_metadata:
         metadata = get_bluez_metadata()
         if metadata:
-            return jsonify({
+            return {
                 "ok": True,
                 "status": metadata.get("status", "Unknown"),
                 "artist": metadata.get("artist", ""),
@@ -561,36 +1083,47 @@ def api_media_status():
                 "album": metadata.get("album", ""),
                 "is_playing": metadata.get("is_playing", False),
                 "source": "bluez"
-            })
+            }
+    
+    # Then MPRIS: status and metadata in one D-Bus GetAll
+    if MPRIS_AVAILABLE and get_mpris_metadata:
+        metadata = get_mpris_metadata()
+        if metadata:
+            return {"ok": True, **metadata, "source": "mpris"}
+    
+    # Fall back to playerctl, using the follower's snapshot when it is running
+    with _media_follow_lock:
+        follow_running = _media_follow["running"]
+        snapshot = _media_follow["snapshot"]
+    if follow_running:
+        return snapshot or NO_PLAYER_STATUS
     
-    # Fall back to playerctl
     player = get_active_player()
     
     if not player:
-        return jsonify({
-            "ok": False,
-            "status": "no-player",
-            "message": "No media player connected",
-            "artist": "",
-            "title": "",
-            "album": "",
-            "is_playing": False
-        })
+        return NO_PLAYER_STATUS
     
     def pc(*args):
         """Helper to run playerctl with the active player."""
         try:
-            cmd = ["playerctl", "-p", player] + list(args)
-            return subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=5).strip()
-        except:
+            cmd = [_PLAYERCTL, "-p", player, *args]
+            return _run_limited(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, check=True).stdout.strip()
+        except (subprocess.SubprocessError, OSError) as e:
+            # TimeoutExpired shows up here too, so slow players are visible
+            logging.debug("playerctl %s failed (%s): %s", args[0], type(e).__name__, e)
             return ""
     
-    status = pc("status")
-    artist = pc("metadata", "artist")
-    title = pc("metadata", "title")
-    album = pc("metadata", "album")
-    
-    return jsonify({
+    if playerctl_supports_format():
+        # Fetch status + metadata in a single playerctl call
+        fields = pc("metadata", "--format", PLAYERCTL_STATUS_FORMAT).split(PLAYERCTL_FIELD_SEP)
+        if len(fields) != 4:
+            fields = ("", "", "", "")
+    else:
+        # Older playerctl: one call per field, in parallel
+        fields = _playerctl_executor.map(lambda args: pc(*args), PLAYERCTL_LEGACY_QUERIES)
+    status, artist, title, album = fields
+    
+    return {
         "ok": True,
         "status": status or "Unknown",
         "artist": artist,
@@ -599,7 +1132,7 @@ def api_media_status():
         "is_playing": status.lower() == "playing" if status else False,
         "player": player,
         "source": "playerctl"
-    })
+    }
 
 @app.route('/api/map/route', methods=['POST'])
 def get_route():
@@ -614,14 +1147,78 @@ def get_route():
 # Location API Endpoints
 # =============================================================================
 
+# Latest phone and Pi locations, kept current by background threads so the
+# location endpoints never wait on a BLE read, WiFi scan or geolocation API.
+# The phone is re-read often (the iPhone bridge posts about once a second).
+# The Pi is re-read every few seconds too, so a GPS fix stays current; its
+# WiFi-scan/IP fallback is only redone once a minute (see PiLocation.get()).
+PHONE_LOCATION_REFRESH_INTERVAL = 2.0  # seconds
+PI_LOCATION_REFRESH_INTERVAL = 5.0  # seconds
+# How long a request right after startup waits for the Pi's first lookup
+PI_LOCATION_FIRST_WAIT = 15.0  # seconds
+_location_snapshot = {"phone": None, "pi": None, "running": False}
+_location_lock = threading.Lock()
+phone_location_posted = threading.Event()
+_pi_location_ready = threading.Event()
+
+def poll_phone_location():
+    """
+    Background thread: refresh the phone location snapshot every
+    PHONE_LOCATION_REFRESH_INTERVAL seconds, or right away when the iPhone
+    bridge posts a new position.
+    """
+    while True:
+        try:
+            loc = PhoneLocation.get_location()
+        except Exception as e:
+            logging.debug("Phone location refresh error: %s", e)
+            loc = None
+        with _location_lock:
+            _location_snapshot["phone"] = loc
+        phone_location_posted.wait(timeout=PHONE_LOCATION_REFRESH_INTERVAL)
+        phone_location_posted.clear()
+
+def poll_pi_location():
+    """Background thread: refresh the Pi location snapshot every PI_LOCATION_REFRESH_INTERVAL seconds."""
+    while True:
+        try:
+            loc = PiLocation.get()
+        except Exception as e:
+            logging.error("Pi location refresh error: %s", e)
+            loc = None
+        with _location_lock:
+            if loc or _location_snapshot["pi"] is None:
+                # A failed lookup keeps the last known location
+                _location_snapshot["pi"] = loc
+        _pi_location_ready.set()
+        time.sleep(PI_LOCATION_REFRESH_INTERVAL)
+
+def get_phone_location():
+    """The phone's location from the snapshot (looked up directly if the threads aren't running)."""
+    if PhoneLocation is None:
+        return None
+    if not _location_snapshot["running"]:
+        return PhoneLocation.get_location()
+    with _location_lock:
+        return _location_snapshot["phone"]
+
+def get_pi_location():
+    """The Pi's location from the snapshot (looked up directly if the threads aren't running)."""
+    if PiLocation is None:
+        return None
+    if not _location_snapshot["running"]:
+        return PiLocation.get()
+    _pi_location_ready.wait(timeout=PI_LOCATION_FIRST_WAIT)
+    with _location_lock:
+        return _location_snapshot["pi"]
+
 @app.route('/api/location/phone')
 def phone_location():
     """Get location from connected Bluetooth phone (iPhone or Android)"""
     try:
-        from backend.modules.phone_location import PhoneLocation
-        loc = PhoneLocation.get_location()
+        loc = get_phone_location()
         if loc:
-            return jsonify({
+            return json_response({
                 "ok": True,
                 "lat": loc["lat"],
                 "lon": loc["lon"],
@@ -630,10 +1227,50 @@ def phone_location():
                 "age_seconds": loc.get("age_seconds", 0),
                 "device_type": bluetooth.connected_device_type
             })
-        return jsonify({"ok": False, "message": "Phone location not available"})
+        return json_response({"ok": False, "message": "Phone location not available"})
     except Exception as e:
-        logging.error(f"Phone location error: {e}")
-        return jsonify({"ok": False, "message": str(e)})
+        logging.error("Phone location error: %s", e)
+        return json_response({"ok": False, "message": str(e)})
+
+def parse_location_post(body):
+    """
+    Parse and check an iPhone bridge location post, straight from the raw
+    body. Raises ValueError with a message for the client if it's unusable.
+    
+    Returns:
+        dict: lat, lon, accuracy and timestamp for PhoneLocation.update_ios_location()
+    """
+    try:
+        data = decode_json(body) if body else {}
+    except ValueError:
+        raise ValueError("Invalid JSON")
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    
+    lat = data.get('lat')
+    lon = data.get('lon')
+    if lat is None or lon is None:
+        raise ValueError("Missing lat/lon")
+    try:
+        lat = float(lat)
+        lon = float(lon)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid lat/lon")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("Invalid lat/lon")
+    
+    accuracy = data.get('accuracy')
+    if accuracy is not None:
+        try:
+            accuracy = float(accuracy)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid accuracy")
+    
+    timestamp = data.get('timestamp')
+    if timestamp is not None and not isinstance(timestamp, str):
+        raise ValueError("Invalid timestamp")
+    
+    return {"lat": lat, "lon": lon, "accuracy": accuracy, "timestamp": timestamp}
 
 @app.route('/api/phone/location', methods=['POST'])
 def update_phone_location():
@@ -642,50 +1279,46 @@ def update_phone_location():
     Expected JSON: {"lat": <float>, "lon": <float>, "accuracy": <float>, "timestamp": "..."}
     """
     try:
-        from backend.modules.phone_location import PhoneLocation
-        data = request.json or {}
-        
-        lat = data.get('lat')
-        lon = data.get('lon')
-        
-        if lat is None or lon is None:
-            return jsonify({"ok": False, "error": "Missing lat/lon"}), 400
-        
-        PhoneLocation.update_ios_location(
-            lat=lat,
-            lon=lon,
-            accuracy=data.get('accuracy'),
-            timestamp=data.get('timestamp')
-        )
-        
-        return jsonify({"ok": True, "message": "Location updated"})
+        location = parse_location_post(request.get_data())
+    except ValueError as e:
+        # Malformed post; the client's problem, not ours
+        logging.debug("Bad phone location update: %s", e)
+        return json_response({"ok": False, "error": str(e)}, 400)
+    
+    if PhoneLocation is None:
+        return json_response({"ok": False, "error": "Phone location not available"}, 503)
+    
+    try:
+        PhoneLocation.update_ios_location(**location)
+        phone_location_posted.set()
+        return json_response({"ok": True, "message": "Location updated"})
     except Exception as e:
-        logging.error(f"Phone location update error: {e}")
-        return jsonify({"ok": False, "error": str(e)}), 500
+        logging.error("Phone location update error: %s", e)
+        return json_response({"ok": False, "error": str(e)}, 500)
 
 @app.route('/api/phone/location/status')
 def phone_location_status():
     """Get status of phone location providers"""
+    if PhoneLocation is None:
+        return jsonify({"error": "Phone location not available"})
     try:
-        from backend.modules.phone_location import PhoneLocation
         return jsonify(PhoneLocation.get_status())
     except Exception as e:
+        logging.debug("Phone location status error: %s", e)
         return jsonify({"error": str(e)})
 
 @app.route('/api/debug/gps', methods=['POST'])
 def debug_gps():
     """Debug endpoint to verify iPhone GPS is being received"""
     data = request.json or {}
-    logging.info(f"DEBUG GPS received: lat={data.get('lat')}, lon={data.get('lon')}, accuracy={data.get('accuracy')}")
-    print(f"📍 DEBUG GPS: {data}")
+    logging.info("DEBUG GPS received: lat=%s, lon=%s, accuracy=%s", data.get('lat'), data.get('lon'), data.get('accuracy'))
     return jsonify({"status": "ok", "received": data})
 
 @app.route('/api/location/pi')
 def pi_location():
     """Get Pi's location via GPS or IP geolocation"""
     try:
-        from backend.modules.location_module import PiLocation
-        loc = PiLocation.get()
+        loc = get_pi_location()
         if loc:
             return jsonify({
                 "ok": True,
@@ -697,6 +1330,7 @@ def pi_location():
             })
         return jsonify({"ok": False, "message": "Could not determine location"})
     except Exception as e:
+        logging.error("Pi location error: %s", e)
         return jsonify({"ok": False, "message": str(e)})
 
 @app.route('/api/location/current')
@@ -714,16 +1348,13 @@ def current_location():
     Returns:
         JSON: { lat, lng, accuracy, source }
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
-        # Try phone location first (using PhoneLocation for iPhone/Android)
-        from backend.modules.phone_location import PhoneLocation
-        phone_loc = PhoneLocation.get_location()
+        # Try phone location first (using PhoneLocation for iPhone/Android).
+        # The map polls this, so the per-call source logging is debug only.
+        phone_loc = get_phone_location()
         if phone_loc:
-            logger.info(f"Location from phone: {phone_loc['lat']}, {phone_loc['lon']}")
-            return jsonify({
+            logging.debug("Location from phone: %s, %s", phone_loc['lat'], phone_loc['lon'])
+            return json_response({
                 "ok": True,
                 "lat": phone_loc["lat"],
                 "lng": phone_loc["lon"],
@@ -735,8 +1366,7 @@ def current_location():
         
         # Try Pi location (GPS -> WiFi -> IP)
         # This now uses WiFi-based Google Geolocation as primary method
-        from backend.modules.location_module import PiLocation
-        pi_loc = PiLocation.get()
+        pi_loc = get_pi_location()
         if pi_loc:
             source = pi_loc.get("source", "pi")
             accuracy = pi_loc.get("accuracy", 5000)
@@ -744,13 +1374,13 @@ def current_location():
             
             # Log location source details
             if source == "wifi_google":
-                logger.info(f"WiFi location: {pi_loc['lat']}, {pi_loc['lon']} (±{accuracy}m, {wifi_count} networks)")
+                logging.debug("WiFi location: %s, %s (±%sm, %s networks)", pi_loc['lat'], pi_loc['lon'], accuracy, wifi_count)
             elif source == "gps":
-                logger.info(f"GPS location: {pi_loc['lat']}, {pi_loc['lon']} (±{accuracy}m)")
+                logging.debug("GPS location: %s, %s (±%sm)", pi_loc['lat'], pi_loc['lon'], accuracy)
             elif source == "ip_fallback":
-                logger.warning(f"IP fallback location: {pi_loc['lat']}, {pi_loc['lon']} (±{accuracy}m)")
+                logging.debug("IP fallback location: %s, %s (±%sm)", pi_loc['lat'], pi_loc['lon'], accuracy)
             
-            return jsonify({
+            return json_response({
                 "ok": True,
                 "lat": pi_loc["lat"],
                 "lng": pi_loc["lon"],
@@ -762,8 +1392,8 @@ def current_location():
             })
         
         # Fallback to default location
-        logger.warning("All location methods failed, using default")
-        return jsonify({
+        logging.warning("All location methods failed, using default")
+        return json_response({
             "ok": True,
             "lat": 43.6532,
             "lng": -79.3832,
@@ -772,8 +1402,8 @@ def current_location():
             "source": "default"
         })
     except Exception as e:
-        logger.error(f"Location error: {e}")
-        return jsonify({"ok": False, "error": str(e)})
+        logging.error("Location error: %s", e)
+        return json_response({"ok": False, "error": str(e)})
 
 
 @app.route('/api/location/accurate')
@@ -818,33 +1448,339 @@ def wifi_scan():
 # Places Search API (Overpass for POI)
 # =============================================================================
 
+# One pooled session for outbound API calls (Overpass, Google Places), so
+# repeat searches reuse a kept-alive TLS connection. Overpass answers 429
+# when busy and asks for a retry; the queries are idempotent, so POST is
+# retried as well. pool_maxsize leaves room for the nearby_multi threads plus
+# plain /api/places/nearby requests hitting the same host at once.
+_http_session = requests.Session()
+_http_session.headers.update({"User-Agent": "car_stereo_system"})
+_http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"])
+    )
+))
+
+# Earth's radius in meters
+EARTH_RADIUS_M = 6371000
+_DEG_TO_RAD = math.pi / 180
+
 def compute_distance_meters(lat1, lon1, lat2, lon2):
     """
-    Calculate distance between two coordinates using Haversine formula.
-    Returns distance in meters.
+    Calculate distance between two coordinates (float degrees) using
+    Haversine formula. Returns distance in meters.
     """
-    import math
-    
-    lat1, lon1, lat2, lon2 = map(float, [lat1, lon1, lat2, lon2])
-    lat1_r, lon1_r, lat2_r, lon2_r = map(math.radians, [lat1, lon1, lat2, lon2])
+    s_dlat = math.sin((lat2 - lat1) * _DEG_TO_RAD * 0.5)
+    s_dlon = math.sin((lon2 - lon1) * _DEG_TO_RAD * 0.5)
     
-    dlat = lat2_r - lat1_r
-    dlon = lon2_r - lon1_r
+    a = s_dlat * s_dlat + math.cos(lat1 * _DEG_TO_RAD) * math.cos(lat2 * _DEG_TO_RAD) * s_dlon * s_dlon
     
-    a = math.sin(dlat/2)**2 + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    
-    # Earth's radius in meters
-    r = 6371000
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+# Searches up to this radius use the flat-earth (cheap-ruler) approximation,
+# whose error stays far below 0.1% at this scale
+CHEAP_RULER_MAX_RADIUS = 100000  # meters
+
+# WGS84 ellipsoid, for cheap_ruler_factors()
+_WGS84_RADIUS_M = 6378137.0
+_WGS84_FLATTENING = 1 / 298.257223563
+_WGS84_E2 = _WGS84_FLATTENING * (2 - _WGS84_FLATTENING)
+
+def cheap_ruler_factors(lat):
+    """
+    Meters per degree of longitude (kx) and of latitude (ky) around the given
+    latitude, as in mapbox/cheap-ruler. One cos() call covers every distance
+    measured from that latitude.
+    """
+    m = math.radians(1) * _WGS84_RADIUS_M
+    cos_lat = math.cos(math.radians(lat))
+    w2 = 1 / (1 - _WGS84_E2 * (1 - cos_lat * cos_lat))
+    w = math.sqrt(w2)
+    return m * w * cos_lat, m * w * w2 * (1 - _WGS84_E2)
+
+def compute_distances_meters(lat, lon, lats, lons, max_radius=None):
+    """
+    Distance from (lat, lon) to every point in lats/lons, in meters.
+    When all points are within max_radius <= CHEAP_RULER_MAX_RADIUS meters
+    this is a flat-earth approximation (no trig per point), otherwise haversine.
+    For haversine, points outside the bounding box of max_radius skip the trig
+    and come back as math.inf.
+    Computed in one vectorized pass with numpy when it is installed.
+    Returns a list of floats.
+    """
+    lat = float(lat)
+    lon = float(lon)
+    
+    if max_radius is not None and max_radius <= CHEAP_RULER_MAX_RADIUS:
+        kx, ky = cheap_ruler_factors(lat)
+        if NUMPY_AVAILABLE:
+            # Longitude difference wrapped into [-180, 180)
+            dx = ((np.asarray(lons, dtype=float) - lon + 180) % 360 - 180) * kx
+            dy = (np.asarray(lats, dtype=float) - lat) * ky
+            return np.hypot(dx, dy).tolist()
+        return [
+            math.hypot(((float(p_lon) - lon + 180) % 360 - 180) * kx, (float(p_lat) - lat) * ky)
+            for p_lat, p_lon in zip(lats, lons)
+        ]
+    
+    box = _bounding_box_degrees(lat, max_radius) if max_radius is not None else None
+    
+    if not NUMPY_AVAILABLE:
+        return _haversine_from(lat, lon, lats, lons, box)
+    
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    distances = np.full(len(lats), math.inf)
+    inside = slice(None)
+    if box is not None:
+        max_dlat, max_dlon = box
+        inside = np.abs(lats - lat) <= max_dlat
+        if max_dlon is not None:
+            inside &= np.abs((lons - lon + 180) % 360 - 180) <= max_dlon
+        lats = lats[inside]
+        lons = lons[inside]
+    
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    lats_r = np.radians(lats)
+    lons_r = np.radians(lons)
+    
+    dlat = lats_r - lat_r
+    dlon = lons_r - lon_r
+    
+    a = np.sin(dlat/2)**2 + math.cos(lat_r) * np.cos(lats_r) * np.sin(dlon/2)**2
+    distances[inside] = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+    return distances.tolist()
+
+def _bounding_box_degrees(lat, radius):
+    """
+    Half-height and half-width, in degrees, of the lat/lon box around a point
+    at lat that holds every point within radius meters (on the haversine
+    sphere). The half-width is None if the circle reaches over a pole.
+    """
+    r = radius / EARTH_RADIUS_M
+    max_dlat = math.degrees(r)
+    sin_r = math.sin(r)
+    cos_lat = math.cos(math.radians(lat))
+    if r >= math.pi / 2 or sin_r >= cos_lat:
+        return max_dlat, None
+    return max_dlat, math.degrees(math.asin(sin_r / cos_lat))
+
+def _haversine_from(lat, lon, lats, lons, box=None):
+    """
+    Pure-Python haversine from one origin (float degrees) to many points. The
+    origin's cosine is worked out once, leaving three trig calls per point.
+    Points outside box (from _bounding_box_degrees) get math.inf without any trig.
+    """
+    sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+    half_rad = _DEG_TO_RAD * 0.5
+    cos_lat = cos(lat * _DEG_TO_RAD)
+    diameter = 2 * EARTH_RADIUS_M
+    max_dlat, max_dlon = box or (math.inf, None)
+    inf = math.inf
+    distances = []
+    for p_lat, p_lon in zip(lats, lons):
+        if abs(p_lat - lat) > max_dlat or (
+                max_dlon is not None and abs((p_lon - lon + 180) % 360 - 180) > max_dlon):
+            distances.append(inf)
+            continue
+        s_dlat = sin((p_lat - lat) * half_rad)
+        s_dlon = sin((p_lon - lon) * half_rad)
+        a = s_dlat * s_dlat + cos_lat * cos(p_lat * _DEG_TO_RAD) * s_dlon * s_dlon
+        distances.append(diameter * asin(sqrt(a)))
+    return distances
+
+def _parse_radius(radius):
+    """Search radius parameter in meters, or None if it isn't a number."""
+    try:
+        return float(radius)
+    except (TypeError, ValueError):
+        return None
+
+def _parse_limit(limit):
+    """Result limit parameter, or None if it isn't a positive integer."""
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return None
+    return limit if limit > 0 else None
+
+def nearest_indices(distances, radius_m, limit):
+    """
+    Indices of the closest places within radius_m, closest first, at most
+    limit of them. Only the top `limit` are sorted: argpartition with numpy,
+    heapq.nsmallest otherwise. distances is the list from
+    compute_distances_meters(), which stays a list of plain floats so the
+    picked values serialize as-is.
+    """
+    if NUMPY_AVAILABLE:
+        dist = np.asarray(distances, dtype=float)
+        idx = np.flatnonzero(dist <= radius_m)
+        if len(idx) > limit:
+            idx = idx[np.argpartition(dist[idx], limit)[:limit]]
+        return idx[np.argsort(dist[idx], kind='stable')].tolist()
     
-    return c * r
+    in_range = (i for i in range(len(distances)) if distances[i] <= radius_m)
+    return heapq.nsmallest(limit, in_range, key=distances.__getitem__)
 
 def meters_to_miles(meters):
     """Convert meters to miles."""
     return meters / 1609.344
 
 
-def _search_google_places(lat, lon, place_type, radius, api_key):
+# Map our types to Google Place types
+GOOGLE_PLACE_TYPES = {
+    'fuel': 'gas_station',
+    'gas': 'gas_station',
+    'restaurant': 'restaurant',
+    'food': 'restaurant',
+    'parking': 'parking',
+    'hospital': 'hospital',
+    'pharmacy': 'pharmacy',
+    'atm': 'atm',
+    'charging': 'electric_vehicle_charging_station',
+    'hotel': 'lodging',
+    'supermarket': 'supermarket'
+}
+
+# Human-readable type names
+PLACE_TYPE_NAMES = {
+    'fuel': 'Gas Stations',
+    'gas': 'Gas Stations',
+    'restaurant': 'Restaurants',
+    'food': 'Food & Dining',
+    'parking': 'Parking',
+    'hospital': 'Hospitals',
+    'pharmacy': 'Pharmacies',
+    'atm': 'ATMs',
+    'charging': 'EV Charging',
+    'hotel': 'Hotels',
+    'supermarket': 'Supermarkets'
+}
+
+# Map place types to Overpass tags
+OVERPASS_PLACE_TAGS = {
+    'fuel': '["amenity"="fuel"]',
+    'gas': '["amenity"="fuel"]',
+    'restaurant': '["amenity"="restaurant"]',
+    'food': '["amenity"~"restaurant|fast_food|cafe"]',
+    'parking': '["amenity"="parking"]',
+    'hospital': '["amenity"="hospital"]',
+    'pharmacy': '["amenity"="pharmacy"]',
+    'atm': '["amenity"="atm"]',
+    'charging': '["amenity"="charging_station"]',
+    'hotel': '["tourism"="hotel"]',
+    'supermarket': '["shop"="supermarket"]'
+}
+
+# Overpass QL for nodes with a tag filter within a radius of a point.
+# "qt" returns nodes in quadtile order, which Overpass produces faster than
+# the default sort by id. Results are sorted by distance here anyway.
+OVERPASS_QUERY_TEMPLATE = "[out:json][timeout:15];node%s(around:%d,%s,%s);out body qt;"
+
+def _distance_fields(distance_m):
+    """The distance_m / distance_mi / distance_text fields of a place result."""
+    distance_mi = meters_to_miles(distance_m)
+    return {
+        "distance_m": round(distance_m, 1),
+        "distance_mi": round(distance_mi, 2),
+        "distance_text": f"{distance_mi:.1f} mi" if distance_mi >= 0.1 else f"{int(distance_m)} m"
+    }
+
+def _format_google_place(place, place_lat, place_lon, distance_m, place_type):
+    """Build a place result from a Google Places search result."""
+    return {
+        "lat": place_lat,
+        "lon": place_lon,
+        "name": place.get('name', 'Unknown'),
+        "brand": "",
+        "address": place.get('vicinity', ''),
+        "city": "",
+        "type": place_type,
+        "rating": place.get('rating'),
+        "open_now": place.get('opening_hours', {}).get('open_now'),
+        **_distance_fields(distance_m)
+    }
+
+def _format_overpass_place(element, distance_m, place_type, unnamed):
+    """Build a place result from an Overpass node. unnamed is the fallback name."""
+    tags = element.get("tags", {})
+    
+    # Get name (prefer brand + name combo for gas stations)
+    brand = tags.get("brand", "")
+    name = tags.get("name", "")
+    return {
+        "lat": element["lat"],
+        "lon": element["lon"],
+        "name": f"{brand} - {name}" if brand and name and brand != name else brand or name or unnamed,
+        "brand": brand,
+        "address": tags.get("addr:street", ""),
+        "city": tags.get("addr:city", ""),
+        "type": place_type,
+        **_distance_fields(distance_m)
+    }
+
+# Google Places answers (place, lat, lng), cached on the same grid and for the
+# same times as the Overpass answers below
+GOOGLE_PLACES_MAX_RADIUS = 50000  # meters, the API's limit
+_google_places_cache = {}
+_google_places_cache_lock = threading.Lock()
+
+def _store_places_cache(cache, lock, key, value):
+    """Add an entry to a place search cache, dropping the oldest when it is full."""
+    with lock:
+        if len(cache) >= OVERPASS_CACHE_MAX_ENTRIES:
+            del cache[min(cache, key=lambda k: cache[k][0])]
+        cache[key] = (time.monotonic(), value)
+
+def _fetch_google_places(lat, lon, google_type, radius, api_key):
+    """
+    Get Google Places nearby search results as (place, lat, lng) tuples, with
+    the query snapped to the cache grid. Returns None if the API refused.
+    """
+    lat = round(lat, 3)
+    lon = round(lon, 3)
+    radius = min(math.ceil(radius / OVERPASS_RADIUS_STEP) * OVERPASS_RADIUS_STEP, GOOGLE_PLACES_MAX_RADIUS)
+    key = (google_type, lat, lon, radius)
+    ttl = OVERPASS_CACHE_TTL_FUEL if google_type == 'gas_station' else OVERPASS_CACHE_TTL
+    
+    with _google_places_cache_lock:
+        entry = _google_places_cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+    
+    url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+    params = {
+        'location': f"{lat},{lon}",
+        'radius': radius,
+        'type': google_type,
+        'key': api_key
+    }
+    
+    response = _http_session.get(url, params=params, timeout=15)
+    response.raise_for_status()
+    data = decode_json(response.content)
+    
+    if data.get('status') not in ['OK', 'ZERO_RESULTS']:
+        logging.error("Google Places error: %s", data.get('status'))
+        return None
+    
+    places = []
+    for place in data.get('results', []):
+        location = place.get('geometry', {}).get('location', {})
+        if location.get('lat') is None or location.get('lng') is None:
+            continue
+        places.append((place, location['lat'], location['lng']))
+    
+    _store_places_cache(_google_places_cache, _google_places_cache_lock, key, places)
+    return places
+
+def _search_google_places(lat, lon, place_type, radius, api_key, limit=None):
     """
     Search for places using Google Places API.
     
@@ -854,224 +1790,259 @@ def _search_google_places(lat, lon, place_type, radius, api_key):
         place_type: Type of place (fuel, restaurant, etc.)
         radius: Search radius in meters
         api_key: Google Maps API key
+        limit: Return at most this many (closest) places
         
     Returns:
         List of place results or None if failed
     """
-    import requests as req
-    
-    # Map our types to Google Place types
-    google_type_mapping = {
-        'fuel': 'gas_station',
-        'gas': 'gas_station',
-        'restaurant': 'restaurant',
-        'food': 'restaurant',
-        'parking': 'parking',
-        'hospital': 'hospital',
-        'pharmacy': 'pharmacy',
-        'atm': 'atm',
-        'charging': 'electric_vehicle_charging_station',
-        'hotel': 'lodging',
-        'supermarket': 'supermarket'
-    }
-    
-    google_type = google_type_mapping.get(place_type, place_type)
+    google_type = GOOGLE_PLACE_TYPES.get(place_type, place_type)
     
     try:
-        url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-        params = {
-            'location': f"{lat},{lon}",
-            'radius': radius,
-            'type': google_type,
-            'key': api_key
-        }
-        
-        response = req.get(url, params=params, timeout=15)
-        data = response.json()
-        
-        if data.get('status') not in ['OK', 'ZERO_RESULTS']:
-            logging.error(f"Google Places error: {data.get('status')}")
+        places = _fetch_google_places(lat, lon, google_type, radius, api_key)
+        if places is None:
             return None
         
-        results = []
-        for place in data.get('results', []):
-            place_lat = place.get('geometry', {}).get('location', {}).get('lat')
-            place_lon = place.get('geometry', {}).get('location', {}).get('lng')
-            
-            if place_lat is None or place_lon is None:
-                continue
-            
-            # Calculate distance
-            distance_m = compute_distance_meters(lat, lon, place_lat, place_lon)
-            distance_mi = meters_to_miles(distance_m)
-            
-            results.append({
-                "lat": place_lat,
-                "lon": place_lon,
-                "name": place.get('name', 'Unknown'),
-                "brand": "",
-                "address": place.get('vicinity', ''),
-                "city": "",
-                "type": place_type,
-                "rating": place.get('rating'),
-                "open_now": place.get('opening_hours', {}).get('open_now'),
-                "distance_m": round(distance_m, 1),
-                "distance_mi": round(distance_mi, 2),
-                "distance_text": f"{distance_mi:.1f} mi" if distance_mi >= 0.1 else f"{int(distance_m)} m"
-            })
+        # Distances from the actual position, not the cache grid point.
+        # Calculate all distances in one pass
+        radius_m = _parse_radius(radius)
+        distances = compute_distances_meters(
+            lat, lon, [p[1] for p in places], [p[2] for p in places],
+            max_radius=radius_m
+        )
         
-        # Sort by distance
-        results.sort(key=lambda x: x["distance_m"])
+        # Closest first, then format in that order
+        order = nearest_indices(
+            distances,
+            math.inf if radius_m is None else radius_m,
+            limit or len(places)
+        )
+        results = [
+            _format_google_place(*places[i], distances[i], place_type)
+            for i in order
+        ]
         
-        logging.debug(f"Google Places found {len(results)} {place_type}")
+        logging.debug("Google Places found %s %s", len(results), place_type)
         return results
         
     except Exception as e:
-        logging.error(f"Google Places API error: {e}")
+        logging.error("Google Places API error: %s", e)
         return None
 
 
-@app.route('/api/places/nearby')
-def places_nearby():
-    """Search for places near a location using Google Places API or Overpass API"""
-    import requests as req
-    
-    # Import config for Google API
-    try:
-        sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config'))
-        from config import GOOGLE_MAPS_API_KEY, USE_GOOGLE_MAPS
-    except ImportError:
-        GOOGLE_MAPS_API_KEY = None
-        USE_GOOGLE_MAPS = False
-    
-    lat = request.args.get('lat')
-    lon = request.args.get('lon')
-    place_type = request.args.get('type', 'fuel')  # fuel, restaurant, parking, hospital
-    radius = request.args.get('radius', '5000')  # meters (default 5km)
-    
-    if not lat or not lon:
-        return jsonify({"ok": False, "error": "Missing lat/lon parameters"})
+# Overpass answers, keyed on (tag, lat, lon, radius) rounded so that nearby
+# repeat searches hit the cache. 3 decimal places is a ~111 m grid.
+OVERPASS_CACHE_TTL = 300  # seconds
+# Fuel results go stale faster (stations open and close through the day)
+OVERPASS_CACHE_TTL_FUEL = 60  # seconds
+OVERPASS_CACHE_MAX_ENTRIES = 64
+OVERPASS_RADIUS_STEP = 500  # meters
+_overpass_cache = {}
+_overpass_cache_lock = threading.Lock()
+
+# Public Overpass servers. Each allows only one query per client IP at a time,
+# so parallel searches (/api/places/nearby_multi) take them in turn.
+OVERPASS_ENDPOINTS = (
+    "https://overpass-api.de/api/interpreter",
+    "https://overpass.kumi.systems/api/interpreter",
+)
+
+def _split_overpass_nodes(data):
+    """
+    Split an Overpass answer into the nodes that have coordinates plus their
+    latitudes and longitudes as separate arrays (numpy arrays when numpy is
+    installed), ready for compute_distances_meters(). Done once per answer,
+    so cache hits go straight to the distance math.
     
-    user_lat = float(lat)
-    user_lon = float(lon)
+    Returns:
+        Tuple of (elements, lats, lons)
+    """
+    elements = []
+    lats = []
+    lons = []
+    for element in data.get("elements", ()):
+        p_lat = element.get("lat")
+        p_lon = element.get("lon")
+        if p_lat is None or p_lon is None:
+            continue
+        elements.append(element)
+        lats.append(p_lat)
+        lons.append(p_lon)
+    if NUMPY_AVAILABLE:
+        return elements, np.array(lats, dtype=float), np.array(lons, dtype=float)
+    return elements, lats, lons
+
+def _fetch_overpass(tag, lat, lon, radius, endpoint=OVERPASS_ENDPOINTS[0]):
+    """
+    Get the Overpass nodes matching tag around (lat, lon), with the query
+    snapped to the cache grid. Successful answers are cached, whichever
+    endpoint they came from.
     
-    # Human-readable type names
-    type_names = {
-        'fuel': 'Gas Stations',
-        'gas': 'Gas Stations',
-        'restaurant': 'Restaurants',
-        'food': 'Food & Dining',
-        'parking': 'Parking',
-        'hospital': 'Hospitals',
-        'pharmacy': 'Pharmacies',
-        'atm': 'ATMs',
-        'charging': 'EV Charging',
-        'hotel': 'Hotels',
-        'supermarket': 'Supermarkets'
-    }
+    Returns:
+        Tuple of (elements, lats, lons) from _split_overpass_nodes()
+    """
+    lat = round(lat, 3)
+    lon = round(lon, 3)
+    # Round the radius up so the snapped search still covers the requested area
+    radius = math.ceil(radius / OVERPASS_RADIUS_STEP) * OVERPASS_RADIUS_STEP
+    key = (tag, lat, lon, radius)
+    ttl = OVERPASS_CACHE_TTL_FUEL if tag == '["amenity"="fuel"]' else OVERPASS_CACHE_TTL
+    
+    now = time.monotonic()
+    with _overpass_cache_lock:
+        entry = _overpass_cache.get(key)
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+    
+    query = OVERPASS_QUERY_TEMPLATE % (tag, radius, lat, lon)
+    
+    response = _http_session.post(
+        endpoint,
+        data={"data": query},
+        timeout=20
+    )
+    response.raise_for_status()
+    # Overpass answers can hold thousands of nodes; parse the raw bytes in one
+    # go (orjson on a full buffer beats incremental parsing) so the decoded
+    # result can go straight into the cache
+    nodes = _split_overpass_nodes(decode_json(response.content))
+    
+    _store_places_cache(_overpass_cache, _overpass_cache_lock, key, nodes)
+    return nodes
+
+# Places returned per type unless the request gives ?limit=, and the most it
+# can ask for (the places panel shows far fewer)
+PLACES_DEFAULT_LIMIT = 25
+PLACES_MAX_LIMIT = 50
+
+def search_places(user_lat, user_lon, place_type, radius_m,
+                  limit=PLACES_DEFAULT_LIMIT, overpass_endpoint=OVERPASS_ENDPOINTS[0]):
+    """
+    Find the closest `limit` (at most PLACES_MAX_LIMIT) places of one type
+    near a point, using Google Places API if it is configured and Overpass
+    API otherwise. Overpass errors are raised.
     
-    type_name = type_names.get(place_type, place_type.title())
+    Returns:
+        dict: {ok, type, type_name, count, results[, source]}
+    """
+    type_name = PLACE_TYPE_NAMES.get(place_type, place_type.title())
+    limit = min(limit, PLACES_MAX_LIMIT)
     
     # Try Google Places API first (if available)
     if USE_GOOGLE_MAPS and GOOGLE_MAPS_API_KEY:
-        google_results = _search_google_places(user_lat, user_lon, place_type, radius, GOOGLE_MAPS_API_KEY)
+        google_results = _search_google_places(user_lat, user_lon, place_type, round(radius_m), GOOGLE_MAPS_API_KEY, limit)
         if google_results is not None:
-            return jsonify({
+            return {
                 "ok": True,
                 "type": place_type,
                 "type_name": type_name,
                 "count": len(google_results),
                 "results": google_results,
                 "source": "google"
-            })
+            }
+    
+    tag = OVERPASS_PLACE_TAGS.get(place_type, f'["amenity"="{place_type}"]')
+    elements, lats, lons = _fetch_overpass(tag, user_lat, user_lon, radius_m, overpass_endpoint)
+    
+    # Calculate all distances in one pass
+    distances = compute_distances_meters(user_lat, user_lon, lats, lons, max_radius=radius_m)
+    
+    # Closest first, then format in that order. The cached search is
+    # snapped to a grid and can reach a bit further than the radius, so
+    # those places are dropped.
+    order = nearest_indices(distances, radius_m, limit)
+    unnamed = f"Unnamed {type_name[:-1] if type_name.endswith('s') else type_name}"
+    results = [
+        _format_overpass_place(elements[i], distances[i], place_type, unnamed)
+        for i in order
+    ]
     
-    # Map place types to Overpass tags
-    type_mapping = {
-        'fuel': '["amenity"="fuel"]',
-        'gas': '["amenity"="fuel"]',
-        'restaurant': '["amenity"="restaurant"]',
-        'food': '["amenity"~"restaurant|fast_food|cafe"]',
-        'parking': '["amenity"="parking"]',
-        'hospital': '["amenity"="hospital"]',
-        'pharmacy': '["amenity"="pharmacy"]',
-        'atm': '["amenity"="atm"]',
-        'charging': '["amenity"="charging_station"]',
-        'hotel': '["tourism"="hotel"]',
-        'supermarket': '["shop"="supermarket"]'
+    return {
+        "ok": True,
+        "type": place_type,
+        "type_name": type_name,
+        "count": len(results),
+        "results": results
     }
+
+@app.route('/api/places/nearby')
+def places_nearby():
+    """Search for places near a location using Google Places API or Overpass API"""
+    lat = request.args.get('lat')
+    lon = request.args.get('lon')
+    place_type = request.args.get('type', 'fuel')  # fuel, restaurant, parking, hospital
+    radius = request.args.get('radius', '5000')  # meters (default 5km)
+    limit = _parse_limit(request.args.get('limit', PLACES_DEFAULT_LIMIT))
     
-    tag = type_mapping.get(place_type, f'["amenity"="{place_type}"]')
+    if not lat or not lon:
+        return json_response({"ok": False, "error": "Missing lat/lon parameters"})
+    
+    user_lat = float(lat)
+    user_lon = float(lon)
+    radius_m = _parse_radius(radius)
+    if radius_m is None or radius_m <= 0:
+        return json_response({"ok": False, "error": "Invalid radius"}, 400)
+    if limit is None:
+        return json_response({"ok": False, "error": "Invalid limit"}, 400)
     
-    query = f"""
-    [out:json][timeout:15];
-    node
-      {tag}
-      (around:{radius},{lat},{lon});
-    out body;
+    try:
+        return json_response(search_places(user_lat, user_lon, place_type, radius_m, limit))
+    except Exception as e:
+        logging.error("Overpass API error: %s", e)
+        return json_response({"ok": False, "error": str(e)})
+
+# Searches for /api/places/nearby_multi run on these threads
+PLACES_MULTI_MAX_TYPES = 6
+_places_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="places")
+
+@app.route('/api/places/nearby_multi')
+def places_nearby_multi():
+    """
+    Search several place types at once, e.g. ?types=fuel,food,parking.
+    The searches run in parallel, spread over OVERPASS_ENDPOINTS.
+    Returns one /api/places/nearby result per type under "places".
     """
+    lat = request.args.get('lat')
+    lon = request.args.get('lon')
+    radius = request.args.get('radius', '5000')  # meters (default 5km)
+    limit = _parse_limit(request.args.get('limit', PLACES_DEFAULT_LIMIT))
+    # Drop duplicates and empty entries, keeping the order
+    place_types = list(dict.fromkeys(t for t in request.args.get('types', '').split(',') if t))
+    
+    if not lat or not lon:
+        return json_response({"ok": False, "error": "Missing lat/lon parameters"}, 400)
+    if not place_types or len(place_types) > PLACES_MULTI_MAX_TYPES:
+        return json_response({"ok": False, "error": f"Give 1 to {PLACES_MULTI_MAX_TYPES} types"}, 400)
     
     try:
-        response = req.post(
-            "https://overpass-api.de/api/interpreter",
-            data={"data": query},
-            headers={"User-Agent": "car_stereo_system"},
-            timeout=20
+        user_lat = float(lat)
+        user_lon = float(lon)
+    except ValueError:
+        return json_response({"ok": False, "error": "Invalid lat/lon"}, 400)
+    if not (math.isfinite(user_lat) and math.isfinite(user_lon)):
+        return json_response({"ok": False, "error": "Invalid lat/lon"}, 400)
+    radius_m = _parse_radius(radius)
+    if radius_m is None or radius_m <= 0:
+        return json_response({"ok": False, "error": "Invalid radius"}, 400)
+    if limit is None:
+        return json_response({"ok": False, "error": "Invalid limit"}, 400)
+    
+    futures = {
+        place_type: _places_executor.submit(
+            search_places, user_lat, user_lon, place_type, radius_m, limit,
+            OVERPASS_ENDPOINTS[i % len(OVERPASS_ENDPOINTS)]
         )
-        data = response.json()
-        
-        # Format results with distance calculation
-        results = []
-        for element in data.get("elements", []):
-            tags = element.get("tags", {})
-            place_lat = element.get("lat")
-            place_lon = element.get("lon")
-            
-            if place_lat is None or place_lon is None:
-                continue
-            
-            # Calculate distance
-            distance_m = compute_distance_meters(user_lat, user_lon, place_lat, place_lon)
-            distance_mi = meters_to_miles(distance_m)
-            
-            # Get name (prefer brand + name combo for gas stations)
-            brand = tags.get("brand", "")
-            name = tags.get("name", "")
-            if brand and name and brand != name:
-                display_name = f"{brand} - {name}"
-            elif brand:
-                display_name = brand
-            elif name:
-                display_name = name
-            else:
-                display_name = f"Unnamed {type_name[:-1] if type_name.endswith('s') else type_name}"
-            
-            results.append({
-                "lat": place_lat,
-                "lon": place_lon,
-                "name": display_name,
-                "brand": brand,
-                "address": tags.get("addr:street", ""),
-                "city": tags.get("addr:city", ""),
-                "type": place_type,
-                "distance_m": round(distance_m, 1),
-                "distance_mi": round(distance_mi, 2),
-                "distance_text": f"{distance_mi:.1f} mi" if distance_mi >= 0.1 else f"{int(distance_m)} m"
-            })
-        
-        # Sort by distance (closest first)
-        results.sort(key=lambda x: x["distance_m"])
-        
-        return jsonify({
-            "ok": True,
-            "type": place_type,
-            "type_name": type_name,
-            "count": len(results),
-            "results": results
-        })
-        
-    except Exception as e:
-        logging.error(f"Overpass API error: {e}")
-        return jsonify({"ok": False, "error": str(e)})
+        for i, place_type in enumerate(place_types)
+    }
+    
+    places = {}
+    for place_type, future in futures.items():
+        try:
+            places[place_type] = future.result()
+        except Exception as e:
+            logging.error("Overpass API error (%s): %s", place_type, e)
+            places[place_type] = {"ok": False, "type": place_type, "error": str(e)}
+    
+    return json_response({"ok": True, "places": places})
 
 @app.route('/api/route/to_place')
 def route_to_place():
@@ -1105,7 +2076,7 @@ def route_to_place():
             })
             
     except Exception as e:
-        logging.error(f"Route to place error: {e}")
+        logging.error("Route to place error: %s", e)
         return jsonify({"ok": False, "error": str(e)})
 
 @app.route('/api/android_auto/start', methods=['POST'])
@@ -1140,36 +2111,48 @@ def phone_status():
     
     return jsonify(phone_manager.get_status())
 
+# Phone events arriving this close together (a call coming in sets state,
+# caller ID and name one after another) are sent as one update
+PHONE_EVENTS_COALESCE = 0.02  # seconds
+PHONE_EVENTS_HEARTBEAT = b'data: {"heartbeat":true}\n\n'
+
 @app.route('/api/phone/events')
 def phone_events():
     """
     Server-Sent Events endpoint for real-time phone updates.
     Client should connect via EventSource.
+    Every event is a full phone status, so a burst only needs its last one.
     """
     def generate():
         if not PHONE_MANAGER_AVAILABLE or not phone_manager:
-            yield f"data: {json.dumps({'error': 'Phone manager not available'})}\n\n"
+            yield b"data: " + encode_json({'error': 'Phone manager not available'}) + b"\n\n"
             return
         
         # Send initial status
-        yield f"data: {json.dumps(phone_manager.get_status())}\n\n"
+        yield b"data: " + encode_json(phone_manager.get_status()) + b"\n\n"
         
         # Stream updates
         while True:
             try:
                 # Wait for event with timeout
                 data = phone_manager.event_queue.get(timeout=30)
-                yield f"data: {json.dumps(data)}\n\n"
-            except:
+            except queue.Empty:
                 # Send heartbeat to keep connection alive
-                yield f"data: {json.dumps({'heartbeat': True})}\n\n"
+                yield PHONE_EVENTS_HEARTBEAT
+                continue
+            time.sleep(PHONE_EVENTS_COALESCE)
+            while True:
+                try:
+                    data = phone_manager.event_queue.get_nowait()
+                except queue.Empty:
+                    break
+            yield b"data: " + encode_json(data) + b"\n\n"
     
     return Response(
         generate(),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
             'X-Accel-Buffering': 'no'
         }
     )
@@ -1247,7 +2230,7 @@ def start_voice():
         voice.start_listening()
         return jsonify({"status": "voice_started"})
     except Exception as e:
-        logging.error(f"Error starting voice control: {e}")
+        logging.error("Error starting voice control: %s", e)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 @app.route('/api/voice/stop', methods=['POST'])
@@ -1260,7 +2243,7 @@ def stop_voice():
         voice.stop_listening()
         return jsonify({"status": "voice_stopped"})
     except Exception as e:
-        logging.error(f"Error stopping voice control: {e}")
+        logging.error("Error stopping voice control: %s", e)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 # =============================================================================
@@ -1319,10 +2302,10 @@ def get_navigation_route():
         dest_lat = float(request.args.get("dlat"))
         dest_lon = float(request.args.get("dlon"))
     except (TypeError, ValueError):
-        return jsonify({"ok": False, "error": "Invalid coordinates"}), 400
+        return json_response({"ok": False, "error": "Invalid coordinates"}, 400)
 
     route = google_maps.get_directions(origin_lat, origin_lon, dest_lat, dest_lon)
-    return jsonify(route)
+    return json_response(route)
 
 
 # =============================================================================
@@ -1342,9 +2325,79 @@ def google_directions():
         dest_lat = float(request.args.get("dlat"))
         dest_lon = float(request.args.get("dlon"))
     except (TypeError, ValueError):
-        return jsonify({"ok": False, "error": "Invalid coordinates"}), 400
+        return json_response({"ok": False, "error": "Invalid coordinates"}, 400)
+    
+    return json_response(google_maps.get_directions(origin_lat, origin_lon, dest_lat, dest_lon))
+
+
+# Most legs accepted by /api/google/directions/batch
+GOOGLE_DIRECTIONS_BATCH_MAX = 10
+
+
+def parse_directions_batch(body):
+    """
+    Parse a directions batch body: a JSON array of
+    [origin_lat, origin_lon, dest_lat, dest_lon] legs. Raises ValueError
+    with a message for the client if it's unusable.
     
-    return jsonify(google_maps.get_directions(origin_lat, origin_lon, dest_lat, dest_lon))
+    Returns:
+        list: (origin_lat, origin_lon, dest_lat, dest_lon) float tuples
+    """
+    try:
+        data = decode_json(body) if body else None
+    except ValueError:
+        raise ValueError("Invalid JSON")
+    if not isinstance(data, list) or not 1 <= len(data) <= GOOGLE_DIRECTIONS_BATCH_MAX:
+        raise ValueError(f"Expected a JSON array of 1 to {GOOGLE_DIRECTIONS_BATCH_MAX} legs")
+    
+    legs = []
+    for leg in data:
+        if not isinstance(leg, list) or len(leg) != 4:
+            raise ValueError("Each leg must be [olat, olon, dlat, dlon]")
+        try:
+            legs.append(tuple(float(v) for v in leg))
+        except (TypeError, ValueError):
+            raise ValueError("Invalid coordinates")
+    return legs
+
+
+@app.route('/api/google/directions/batch', methods=['POST'])
+def google_directions_batch():
+    """
+    Google Directions API for several routes at once
+    
+    Body: JSON array of [olat, olon, dlat, dlon] legs
+    Returns one /api/google/directions result per leg under "routes", in order.
+    """
+    try:
+        legs = parse_directions_batch(request.get_data())
+    except ValueError as e:
+        return json_response({"ok": False, "error": str(e)}, 400)
+    
+    return json_response({"ok": True, "routes": google_maps.get_directions_many(legs)})
+
+
+@app.route('/api/google/route')
+def google_route_to_address():
+    """
+    Geocode + Directions in one request - Turn-by-turn navigation to an address
+
+    Query params: olat, olon, address
+
+    Saves the client a second round trip to the Pi; both Google calls go out
+    back to back on the same kept-alive connection.
+    """
+    try:
+        origin_lat = float(request.args.get("olat"))
+        origin_lon = float(request.args.get("olon"))
+    except (TypeError, ValueError):
+        return json_response({"ok": False, "error": "Invalid coordinates"}, 400)
+
+    address = request.args.get("address", "")
+    if not address:
+        return json_response({"ok": False, "error": "Address required"}, 400)
+
+    return json_response(google_maps.route_to_address(origin_lat, origin_lon, address))
 
 
 @app.route('/api/google/places')
@@ -1360,9 +2413,9 @@ def google_places():
         place_type = request.args.get("type", "gas_station")
         radius = int(request.args.get("radius", 5000))
     except (TypeError, ValueError):
-        return jsonify({"ok": False, "error": "Invalid parameters"}), 400
+        return json_response({"ok": False, "error": "Invalid parameters"}, 400)
     
-    return jsonify(google_maps.search_nearby(lat, lon, place_type, radius))
+    return json_response(google_maps.search_nearby(lat, lon, place_type, radius))
 
 
 @app.route('/api/google/geocode')
@@ -1374,9 +2427,9 @@ def google_geocode():
     """
     address = request.args.get("address", "")
     if not address:
-        return jsonify({"ok": False, "error": "Address required"}), 400
+        return json_response({"ok": False, "error": "Address required"}, 400)
     
-    return jsonify(google_maps.geocode(address))
+    return json_response(google_maps.geocode(address))
 
 
 @app.route('/api/google/reverse')
@@ -1390,9 +2443,9 @@ def google_reverse_geocode():
         lat = float(request.args.get("lat"))
         lon = float(request.args.get("lon"))
     except (TypeError, ValueError):
-        return jsonify({"ok": False, "error": "Invalid coordinates"}), 400
+        return json_response({"ok": False, "error": "Invalid coordinates"}, 400)
     
-    return jsonify(google_maps.reverse_geocode(lat, lon))
+    return json_response(google_maps.reverse_geocode(lat, lon))
 
 
 @app.route('/api/google/search')
@@ -1404,7 +2457,7 @@ def google_text_search():
     """
     query = request.args.get("q", "")
     if not query:
-        return jsonify({"ok": False, "error": "Query required"}), 400
+        return json_response({"ok": False, "error": "Query required"}, 400)
     
     lat = request.args.get("lat")
     lon = request.args.get("lon")
@@ -1417,7 +2470,7 @@ def google_text_search():
             lat = None
             lon = None
     
-    return jsonify(google_maps.search_text(query, lat, lon))
+    return json_response(google_maps.search_text(query, lat, lon))
 
 
 @app.route('/api/google/details')
@@ -1429,9 +2482,9 @@ def google_place_details():
     """
     place_id = request.args.get("place_id", "")
     if not place_id:
-        return jsonify({"ok": False, "error": "place_id required"}), 400
+        return json_response({"ok": False, "error": "place_id required"}, 400)
     
-    return jsonify(google_maps.get_place_details(place_id))
+    return json_response(google_maps.get_place_details(place_id))
 
 
 @app.route('/navigation', methods=['GET'])
@@ -1443,30 +2496,116 @@ def navigation_view():
     global current_nav_url
     return render_template('navigation.html', maps_url=current_nav_url)
 
+# Request threads for waitress (and gunicorn.conf.py). Each open SSE stream
+# (/api/phone/events, /api/media/events) holds one, and an Overpass search can
+# take one for up to 20 s, so leave headroom over the number of screens.
+SERVER_THREADS = int(os.environ.get('CAR_STEREO_THREADS', '12'))
+
+def serve(host='0.0.0.0', port=5000, threads=SERVER_THREADS):
+    """
+    Serve the app with a production WSGI server.
+    
+    Every endpoint is I/O-bound (D-Bus, subprocess, HTTP APIs), so waitress's
+    fixed pool of worker threads lets a slow call overlap with the UI's
+    polling instead of queueing behind the Werkzeug debugger and reloader.
+    Falls back to the Flask development server (without debug) if waitress
+    is not installed. With DEV=1 set, the Flask debug server is always used.
+    
+    The default host 0.0.0.0 listens on IPv4 only: Safari on iOS has issues
+    with the geolocation API over IPv6, so the iPhone GPS bridge must be
+    reached over IPv4.
+    """
+    if DEV_MODE:
+        # No reloader: it would re-run __main__ in a child process and start
+        # a second set of background threads talking to the same hardware
+        app.run(host=host, port=port, debug=True, threaded=True, use_reloader=False)
+    elif WAITRESS_AVAILABLE:
+        logging.info("Serving with waitress on %s:%s (%s threads)", host, port, threads)
+        waitress_serve(app, host=host, port=port, threads=threads)
+    else:
+        app.run(host=host, port=port, debug=False, threaded=True)
+
+# Redraw at least this often so the temperature gradient stays current
+SENSE_HAT_REFRESH_INTERVAL = 10  # seconds
+
 def update_sense_hat_display():
-    """Background thread to update Sense HAT display"""
+    """
+    Background thread to update Sense HAT display and the /api/status snapshot.
+    Redraws when system_state changes, or every SENSE_HAT_REFRESH_INTERVAL
+    seconds otherwise, instead of waking up once a second. Sensors are only
+    read on the periodic refresh; a state change keeps the last readings.
+    """
+    failures = 0
+    read_sensors = True
     while True:
         try:
-            sense_hat.update_display(system_state)
-            time.sleep(1)
+            sense_hat.update_display(get_system_state())
+            refresh_status_snapshot(read_sensors)
+            failures = 0
+            read_sensors = not state_changed.wait(timeout=SENSE_HAT_REFRESH_INTERVAL)
+            state_changed.clear()
         except Exception as e:
+            # Back off (2, 4, 8... up to 60 s) while the HAT keeps failing
+            failures += 1
             print(f"Sense HAT update error: {e}")
-            time.sleep(5)
+            time.sleep(min(60, 2 ** failures))
 
-if __name__ == '__main__':
+_background_started = False
+_background_lock = threading.Lock()
+
+def start_background_services():
+    """
+    Start the background threads and warm caches. Called from __main__, or
+    from the gunicorn worker hook in gunicorn.conf.py when served by gunicorn.
+    Only the first call does anything, so each process starts one set of threads.
+    """
+    global _background_started
+    with _background_lock:
+        if _background_started:
+            return
+        _background_started = True
+    
     # Start Sense HAT update thread
     sense_hat_thread = threading.Thread(target=update_sense_hat_display, daemon=True)
     sense_hat_thread.start()
     
+    # Keep the location snapshots fresh so the location endpoints don't block
+    if PhoneLocation is not None:
+        threading.Thread(target=poll_phone_location, daemon=True).start()
+    if PiLocation is not None:
+        threading.Thread(target=poll_pi_location, daemon=True).start()
+    _location_snapshot["running"] = True
+    
+    # Cache MPRIS status between PropertiesChanged signals instead of polling it,
+    # drop the playerctl player cache whenever a player comes or goes, and push
+    # changes to /api/media/events
+    if MPRIS_AVAILABLE and start_mpris_watch and start_mpris_watch():
+        add_player_change_listener(invalidate_active_player)
+        add_media_change_listener(invalidate_media_status)
+        _player_cache["watched"] = True
+    
+    # Cache the BlueZ player and its metadata between signals instead of
+    # polling D-Bus, and push changes to /api/media/events
+    if BLUEZ_MEDIA_AVAILABLE and start_bluez_watch and start_bluez_watch():
+        add_bluez_media_listener(invalidate_media_status)
+        _media_status_cache["bluez_watched"] = True
+    
+    # Stream playerctl status instead of forking on every /api/media/status poll
+    if PLAYERCTL_EXISTS and playerctl_supports_format():
+        threading.Thread(target=follow_playerctl, daemon=True).start()
+    
     # Start Phone Manager (for Bluetooth HFP)
     if PHONE_MANAGER_AVAILABLE and phone_manager:
         phone_manager.start()
     
+    warm_template_cache()
+
+if __name__ == '__main__':
+    start_background_services()
+    
     # Run Flask app
     # Use 0.0.0.0 to allow access from network, port 5000
-    # For production, consider using a different port or reverse proxy
     # Use port 5001 on macOS (5000 is used by AirPlay), 5000 on Pi
-    import sys
     port = 5001 if sys.platform == 'darwin' else 5000
-    app.run(host='0.0.0.0', port=port, debug=True, threaded=True)
+    serve(host='0.0.0.0', port=port)
 
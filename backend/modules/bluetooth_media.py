@@ -2,11 +2,16 @@
 Bluetooth Media Module
 Native BlueZ AVRCP MediaPlayer1 D-Bus interface for controlling phone media playback.
 This works even when playerctl cannot detect the media player.
+
+Once start_bluez_watch() is running, the player's object path is cached until
+BlueZ reports a MediaPlayer1 being added or removed, and its metadata until
+the player's PropertiesChanged says otherwise.
 """
 
 import logging
+import time
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from .dbus_loop import GLIB_LOOP_AVAILABLE, start_glib_loop
 
 # Try to import dbus (only available on Linux)
 try:
@@ -23,11 +28,107 @@ MEDIA_PLAYER_IFACE = "org.bluez.MediaPlayer1"
 DBUS_PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
 DBUS_OBJECT_MANAGER_IFACE = "org.freedesktop.DBus.ObjectManager"
 
+# Without signals, cache the player lookup so steady polling doesn't walk
+# GetManagedObjects every time
+PLAYER_CACHE_TTL = 3.0  # seconds
+
+_player_cache = {"obj": None, "ts": 0.0, "generation": -1}
+_metadata_cache = {"value": None, "generation": -1}
+# "generation" is bumped whenever a MediaPlayer1 comes or goes, and
+# "metadata_generation" on that or any change to the player's properties, so
+# a lookup that races with the change never gets cached as current
+_watch = {"active": False, "generation": 0, "metadata_generation": 0}
+# Callbacks run (on the GLib thread) when playback status or track may have changed
+_media_change_listeners = []
+
+
+def invalidate_bluez_player():
+    """Force the next lookup to scan D-Bus and fetch metadata again."""
+    _player_cache["ts"] = 0.0
+    _watch["generation"] += 1
+    _watch["metadata_generation"] += 1
+
+
+def _notify(listeners):
+    for callback in listeners:
+        try:
+            callback()
+        except Exception as e:
+            logging.debug("BlueZ listener error: %s", e)
+
+
+def _on_interfaces_changed(path, interfaces, *args):
+    """InterfacesAdded/InterfacesRemoved from BlueZ: a phone's player may have come or gone."""
+    if MEDIA_PLAYER_IFACE in interfaces:
+        logging.debug("BlueZ media player changed at %s", path)
+        invalidate_bluez_player()
+        _notify(_media_change_listeners)
+
+
+def _on_properties_changed(interface, changed, invalidated):
+    """PropertiesChanged on a MediaPlayer1: status, track or position changed."""
+    if interface == MEDIA_PLAYER_IFACE:
+        _watch["metadata_generation"] += 1
+        _notify(_media_change_listeners)
+
+
+def add_bluez_media_listener(callback):
+    """
+    Call callback() whenever the BlueZ player's status or track may have
+    changed, including a player appearing or leaving.
+    """
+    _media_change_listeners.append(callback)
+
+
+def start_bluez_watch():
+    """
+    Subscribe to BlueZ's InterfacesAdded/InterfacesRemoved and MediaPlayer1
+    PropertiesChanged signals on the shared GLib main loop, so the player
+    lookup and metadata can be cached between changes.
+    
+    Returns:
+        bool: True if signals are being watched
+    """
+    if _watch["active"]:
+        return True
+    if not (DBUS_AVAILABLE and GLIB_LOOP_AVAILABLE):
+        return False
+    
+    try:
+        bus = dbus.SystemBus()
+        for signal_name in ("InterfacesAdded", "InterfacesRemoved"):
+            bus.add_signal_receiver(
+                _on_interfaces_changed,
+                dbus_interface=DBUS_OBJECT_MANAGER_IFACE,
+                signal_name=signal_name,
+                bus_name=BLUEZ_SERVICE
+            )
+        # arg0 matching keeps the daemon from waking us for every other
+        # BlueZ property (RSSI, battery, ...)
+        bus.add_signal_receiver(
+            _on_properties_changed,
+            dbus_interface=DBUS_PROPERTIES_IFACE,
+            signal_name="PropertiesChanged",
+            bus_name=BLUEZ_SERVICE,
+            arg0=MEDIA_PLAYER_IFACE
+        )
+    except dbus.exceptions.DBusException as e:
+        logging.debug("Could not subscribe to BlueZ signals: %s", e)
+        return False
+    
+    start_glib_loop()
+    invalidate_bluez_player()
+    _watch["active"] = True
+    logging.info("Watching BlueZ for media players")
+    return True
+
 
 def find_bluez_media_player():
     """
     Scan D-Bus for any org.bluez.MediaPlayer1 instances.
     This works even when playerctl cannot see the player.
+    The result is cached until the next InterfacesAdded/Removed signal, or
+    for PLAYER_CACHE_TTL seconds when signals aren't being watched.
     
     Returns:
         dbus.proxies.ProxyObject or None: The media player D-Bus object
@@ -35,10 +136,29 @@ def find_bluez_media_player():
     if not DBUS_AVAILABLE:
         return None
     
+    now = time.monotonic()
+    generation = _watch["generation"]
+    if _watch["active"]:
+        if _player_cache["generation"] == generation:
+            return _player_cache["obj"]
+    elif now - _player_cache["ts"] < PLAYER_CACHE_TTL:
+        return _player_cache["obj"]
+    
+    player = _scan_bluez_media_player()
+    _player_cache["obj"] = player
+    _player_cache["ts"] = now
+    _player_cache["generation"] = generation
+    return player
+
+
+def _scan_bluez_media_player():
+    """Walk BlueZ's managed objects for the first MediaPlayer1 (uncached)."""
     try:
         bus = dbus.SystemBus()
+        # Calls always name their interface, so skip the Introspect round
+        # trip dbus-python would otherwise make on each new proxy
         obj_manager = dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE, "/"),
+            bus.get_object(BLUEZ_SERVICE, "/", introspect=False),
             DBUS_OBJECT_MANAGER_IFACE
         )
         
@@ -46,17 +166,19 @@ def find_bluez_media_player():
         
         for path, interfaces in managed_objects.items():
             if MEDIA_PLAYER_IFACE in interfaces:
-                logging.debug(f"Found BlueZ media player at: {path}")
-                return bus.get_object(BLUEZ_SERVICE, path)
+                logging.debug("Found BlueZ media player at: %s", path)
+                return bus.get_object(BLUEZ_SERVICE, path, introspect=False)
         
         logging.debug("No BlueZ MediaPlayer1 found on D-Bus")
         return None
         
     except dbus.exceptions.DBusException as e:
-        logging.debug(f"D-Bus error finding media player: {e}")
+        logging.debug("D-Bus error finding media player: %s", e)
+        # Don't let a failed scan stand in for "no player"
+        invalidate_bluez_player()
         return None
     except Exception as e:
-        logging.debug(f"Error finding media player: {e}")
+        logging.debug("Error finding media player: %s", e)
         return None
 
 
@@ -65,7 +187,7 @@ def run_bluez_media_command(cmd):
     Run a command on the BlueZ MediaPlayer1 interface.
     
     Args:
-        cmd: Command name - 'Play', 'Pause', 'Next', 'Previous', 'Stop'
+        cmd: Command name - 'Play', 'Pause', 'PlayPause', 'Next', 'Previous', 'Stop'
         
     Returns:
         Tuple of (success: bool, message: str)
@@ -80,16 +202,23 @@ def run_bluez_media_command(cmd):
     try:
         iface = dbus.Interface(player, MEDIA_PLAYER_IFACE)
         
+        if cmd == "PlayPause":
+            # MediaPlayer1 has no PlayPause; read just Status to pick one
+            status = dbus.Interface(player, DBUS_PROPERTIES_IFACE).Get(MEDIA_PLAYER_IFACE, "Status")
+            cmd = "Pause" if str(status).lower() == "playing" else "Play"
+        
         # Get the method and call it
         method = getattr(iface, cmd)
         method()
         
-        logging.debug(f"BlueZ media command '{cmd}' executed successfully")
+        logging.debug("BlueZ media command '%s' executed successfully", cmd)
         return True, f"{cmd} OK"
         
     except dbus.exceptions.DBusException as e:
         error_msg = str(e)
-        logging.debug(f"D-Bus error executing {cmd}: {error_msg}")
+        logging.debug("D-Bus error executing %s: %s", cmd, error_msg)
+        # The player may have gone away; look it up again next time
+        invalidate_bluez_player()
         
         # Provide more helpful error messages
         if "UnknownMethod" in error_msg:
@@ -100,13 +229,15 @@ def run_bluez_media_command(cmd):
             return False, f"D-Bus error: {error_msg}"
             
     except Exception as e:
-        logging.debug(f"Error executing {cmd}: {e}")
+        logging.debug("Error executing %s: %s", cmd, e)
         return False, str(e)
 
 
 def get_bluez_metadata():
     """
-    Get current track metadata from the BlueZ MediaPlayer1 interface.
+    Get current track metadata from the BlueZ MediaPlayer1 interface with a
+    single Properties.GetAll call. While signals are being watched the result
+    is reused until the player reports a change.
     
     Returns:
         dict or None: Dictionary with 'status', 'title', 'artist', 'album' keys
@@ -114,32 +245,33 @@ def get_bluez_metadata():
     if not DBUS_AVAILABLE:
         return None
     
-    player = find_bluez_media_player()
+    generation = _watch["metadata_generation"]
+    if _watch["active"] and _metadata_cache["generation"] == generation:
+        return _metadata_cache["value"]
+    
+    metadata = _fetch_bluez_metadata(find_bluez_media_player())
+    if _watch["active"]:
+        _metadata_cache["value"] = metadata
+        _metadata_cache["generation"] = generation
+    return metadata
+
+
+def _fetch_bluez_metadata(player):
+    """GetAll on the given player's MediaPlayer1 interface (uncached)."""
     if not player:
         return None
     
     try:
-        props = dbus.Interface(player, DBUS_PROPERTIES_IFACE)
-        
-        # Get player status
-        try:
-            status = props.Get(MEDIA_PLAYER_IFACE, "Status")
-            status = str(status)
-        except:
-            status = "Unknown"
+        # Status and Track in one round trip instead of a Get for each
+        props = dbus.Interface(player, DBUS_PROPERTIES_IFACE).GetAll(MEDIA_PLAYER_IFACE)
         
-        # Get track metadata
-        try:
-            track = props.Get(MEDIA_PLAYER_IFACE, "Track")
-            title = str(track.get("Title", "")) if track else ""
-            artist = str(track.get("Artist", "")) if track else ""
-            album = str(track.get("Album", "")) if track else ""
-        except:
-            title = ""
-            artist = ""
-            album = ""
+        status = str(props.get("Status", "Unknown"))
+        track = props.get("Track") or {}
+        title = str(track.get("Title", ""))
+        artist = str(track.get("Artist", ""))
+        album = str(track.get("Album", ""))
         
-        logging.debug(f"BlueZ metadata - Status: {status}, Title: {title}, Artist: {artist}")
+        logging.debug("BlueZ metadata - Status: %s, Title: %s, Artist: %s", status, title, artist)
         
         return {
             "status": status,
@@ -150,10 +282,11 @@ def get_bluez_metadata():
         }
         
     except dbus.exceptions.DBusException as e:
-        logging.debug(f"D-Bus error getting metadata: {e}")
+        logging.debug("D-Bus error getting metadata: %s", e)
+        invalidate_bluez_player()
         return None
     except Exception as e:
-        logging.debug(f"Error getting metadata: {e}")
+        logging.debug("Error getting metadata: %s", e)
         return None
 
 
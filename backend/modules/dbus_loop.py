@@ -0,0 +1,59 @@
+"""
+D-Bus Main Loop
+One shared GLib main loop thread that dispatches D-Bus signals for every module.
+
+dbus-python delivers signals through the default GLib main context, which only
+one thread can iterate, so modules that listen for signals (phone_manager,
+mpris_media) register their receivers and then call start_glib_loop() instead
+of running their own loop.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Try to import the dbus-python GLib integration (only available on Linux)
+try:
+    import dbus.mainloop.glib
+    from gi.repository import GLib
+    GLIB_LOOP_AVAILABLE = True
+except ImportError:
+    GLIB_LOOP_AVAILABLE = False
+
+# Bus connections pick up the default main loop when they are created, so
+# install it as soon as any signal-using module is imported.
+if GLIB_LOOP_AVAILABLE:
+    dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+
+_loop_lock = threading.Lock()
+_loop = None
+_loop_thread = None
+
+
+def _run_loop():
+    """Run the GLib main loop until the process exits."""
+    try:
+        logger.info("GLib main loop starting...")
+        _loop.run()
+    except Exception as e:
+        logger.error("GLib loop error: %s", e)
+
+
+def start_glib_loop():
+    """
+    Start the shared GLib main loop thread if it isn't running yet.
+
+    Returns:
+        bool: True if the loop is running
+    """
+    global _loop, _loop_thread
+    if not GLIB_LOOP_AVAILABLE:
+        return False
+
+    with _loop_lock:
+        if _loop_thread is None or not _loop_thread.is_alive():
+            _loop = GLib.MainLoop()
+            _loop_thread = threading.Thread(target=_run_loop, daemon=True)
+            _loop_thread.start()
+    return True
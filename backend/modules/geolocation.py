@@ -5,11 +5,11 @@ Works on Raspberry Pi by scanning nearby WiFi networks
 """
 
 import subprocess
+import shutil
 import re
 import requests
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # Google API Key
@@ -26,6 +26,36 @@ except ImportError:
 
 GEOLOCATION_URL = f"https://www.googleapis.com/geolocation/v1/geolocate?key={GOOGLE_API_KEY}"
 
+# Reuse connections (and their TLS sessions) across geolocation lookups
+_session = requests.Session()
+
+# Resolve the WiFi scan tools once at import. iw/iwlist live in /usr/sbin,
+# which isn't on a normal user's PATH, so look there too.
+_SBIN_PATH = os.pathsep.join([os.environ.get("PATH", ""), "/usr/sbin", "/sbin"])
+_IW = shutil.which("iw", path=_SBIN_PATH)
+_IWLIST = shutil.which("iwlist", path=_SBIN_PATH)
+_SUDO = shutil.which("sudo")
+
+
+def _build_scan_commands():
+    """
+    List (tool, argv) pairs for the scan tools that are installed, in the
+    order to try them: non-sudo first (if permissions granted), then sudo.
+    """
+    commands = []
+    for tool, path, args in (("iw", _IW, ["dev", "wlan0", "scan"]),
+                             ("iwlist", _IWLIST, ["wlan0", "scan"])):
+        if not path:
+            continue
+        commands.append((tool, [path] + args))
+        if _SUDO:
+            # -n = non-interactive (no password prompt)
+            commands.append((tool, [_SUDO, "-n", path] + args))
+    return commands
+
+
+SCAN_COMMANDS = _build_scan_commands()
+
 
 def frequency_to_channel(freq_mhz):
     """
@@ -70,19 +100,14 @@ def scan_wifi_networks():
     """
     access_points = {}
     
-    # Try different scan commands
-    # Order: non-sudo first (if permissions granted), then sudo
-    scan_commands = [
-        ["iw", "dev", "wlan0", "scan"],
-        ["sudo", "-n", "iw", "dev", "wlan0", "scan"],  # -n = non-interactive (no password prompt)
-        ["iwlist", "wlan0", "scan"],
-        ["sudo", "-n", "iwlist", "wlan0", "scan"],
-    ]
-    
     scan_output = None
     used_command = None
     
-    for cmd in scan_commands:
+    if not SCAN_COMMANDS:
+        logger.error("No WiFi scan tool (iw or iwlist) installed")
+        return []
+    
+    for tool, cmd in SCAN_COMMANDS:
         try:
             logger.debug(f"Trying WiFi scan command: {' '.join(cmd)}")
             result = subprocess.run(
@@ -93,7 +118,7 @@ def scan_wifi_networks():
             )
             if result.returncode == 0 and result.stdout:
                 scan_output = result.stdout
-                used_command = cmd[0]
+                used_command = tool
                 logger.debug(f"WiFi scan successful with: {' '.join(cmd)}")
                 break
             else:
@@ -110,7 +135,7 @@ def scan_wifi_networks():
         return []
     
     # Parse based on command used
-    if "iw" in used_command:
+    if used_command == "iw":
         access_points = parse_iw_scan(scan_output)
     else:
         access_points = parse_iwlist_scan(scan_output)
@@ -269,7 +294,7 @@ def get_accurate_location():
     
     # Step 3: Call Google Geolocation API
     try:
-        response = requests.post(
+        response = _session.post(
             GEOLOCATION_URL,
             json=request_body,
             headers={"Content-Type": "application/json"},
@@ -329,7 +354,7 @@ def get_location_with_fallback():
     # Fallback to IP-based location
     try:
         # Try ipinfo.io
-        response = requests.get("https://ipinfo.io/json", timeout=5)
+        response = _session.get("https://ipinfo.io/json", timeout=5)
         if response.status_code == 200:
             data = response.json()
             loc = data.get('loc', '').split(',')
@@ -348,7 +373,7 @@ def get_location_with_fallback():
     
     # Final fallback - Google with IP consideration
     try:
-        response = requests.post(
+        response = _session.post(
             GEOLOCATION_URL,
             json={"considerIp": True},
             headers={"Content-Type": "application/json"},
@@ -7,14 +7,49 @@ The hardcoded API key was intentionally removed for public release.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from collections import OrderedDict
+from itertools import accumulate
 import logging
 import re
 import os
+import threading
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# orjson parses the larger Directions/Places bodies several times faster;
+# app.py already warns when it is missing, so just fall back quietly here
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Google Maps web service endpoints
+_DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
+_NEARBY_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+_PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+_TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+_PLACE_DETAILS_FIELDS = (
+    "name,formatted_address,formatted_phone_number,opening_hours,"
+    "website,rating,reviews,price_level,geometry"
+)
+
+def _decode_response(response):
+    """Parse a Google API response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# HTML tags in Directions step instructions
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 # Google Maps API Key
 # SECURITY: Load from config or environment variable. Hardcoded key removed.
 try:
@@ -25,10 +60,116 @@ try:
 except ImportError:
     GOOGLE_API_KEY = os.environ.get('GOOGLE_MAPS_API_KEY', 'PUT_API_KEY_HERE')
 
+# One pooled session for every Google call, so a route followed by place and
+# geocode lookups reuses the kept-alive TLS connection to maps.googleapis.com
+# instead of handshaking each time. Only GETs are made, which Retry covers
+# by default.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504]
+    )
+))
+
+# get_directions_many() fans out on these threads; matches the session pool
+# size so every call gets its own kept-alive connection
+DIRECTIONS_BATCH_WORKERS = 8
+_directions_executor = ThreadPoolExecutor(
+    max_workers=DIRECTIONS_BATCH_WORKERS, thread_name_prefix="directions"
+)
+
+# =============================================================================
+# Response cache
+# =============================================================================
+
+# Successful answers are kept in-process for these many seconds, so repeat
+# lookups (same route, the same nearby poll) skip the round trip to Google
+CACHE_TTLS = {
+    "directions": 60,
+    "nearby": 300,
+    "geocode": 86400,
+    "reverse_geocode": 86400,
+    "place_details": 3600,
+    "text_search": 300,
+}
+CACHE_MAX_ENTRIES = 1024
+# key -> (expires_at, result), oldest stored first
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _coord(value, places=5):
+    """Round a coordinate (5 decimals is ~1 m) so GPS jitter still hits the cache."""
+    return round(value, places) if isinstance(value, (int, float)) else value
+
+
+def _address_key(address):
+    """Addresses differing only in case or spacing geocode the same."""
+    return " ".join(address.split()).casefold()
+
+
+def _cached(kind, key_func):
+    """
+    Decorator: cache a function's {"ok": True, ...} results for CACHE_TTLS[kind]
+    seconds, keyed on key_func(*args, **kwargs). Errors are never cached.
+    Cached results are shared between callers and must not be mutated.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (kind, key_func(*args, **kwargs))
+            with _cache_lock:
+                entry = _cache.get(key)
+                if entry:
+                    if time.monotonic() < entry[0]:
+                        return entry[1]
+                    del _cache[key]
+            
+            result = func(*args, **kwargs)
+            if result.get("ok"):
+                with _cache_lock:
+                    now = time.monotonic()
+                    _cache.pop(key, None)
+                    # Drop expired entries from the old end first, then the
+                    # oldest live ones if it's still full
+                    while _cache and next(iter(_cache.values()))[0] <= now:
+                        _cache.popitem(last=False)
+                    while len(_cache) >= CACHE_MAX_ENTRIES:
+                        _cache.popitem(last=False)
+                    _cache[key] = (now + CACHE_TTLS[kind], result)
+            return result
+        return wrapper
+    return decorator
+
 # =============================================================================
 # Directions API - Turn-by-Turn Navigation
 # =============================================================================
 
+def _format_step(step):
+    """One Directions step, with the instruction also given as plain text."""
+    html = step.get("html_instructions", "")
+    return {
+        "instruction": _HTML_TAG_RE.sub('', html),
+        "html": html,
+        "distance": step["distance"]["text"],
+        "distance_meters": step["distance"]["value"],
+        "duration": step["duration"]["text"],
+        "duration_seconds": step["duration"]["value"],
+        "start_lat": step["start_location"]["lat"],
+        "start_lon": step["start_location"]["lng"],
+        "end_lat": step["end_location"]["lat"],
+        "end_lon": step["end_location"]["lng"],
+        "maneuver": step.get("maneuver", "straight"),
+        "polyline": step.get("polyline", {}).get("points", "")
+    }
+
+
+@_cached("directions", lambda origin_lat, origin_lon, dest_lat, dest_lon, units="imperial": (
+    _coord(origin_lat), _coord(origin_lon), _coord(dest_lat), _coord(dest_lon), units))
 def get_directions(origin_lat, origin_lon, dest_lat, dest_lon, units="imperial"):
     """
     Get turn-by-turn directions from Google Directions API.
@@ -43,18 +184,17 @@ def get_directions(origin_lat, origin_lon, dest_lat, dest_lon, units="imperial")
     Returns:
         Dictionary with route data or error
     """
-    url = (
-        f"https://maps.googleapis.com/maps/api/directions/json?"
-        f"origin={origin_lat},{origin_lon}&"
-        f"destination={dest_lat},{dest_lon}&"
-        f"mode=driving&"
-        f"units={units}&"
-        f"key={GOOGLE_API_KEY}"
-    )
+    params = {
+        "origin": f"{origin_lat},{origin_lon}",
+        "destination": f"{dest_lat},{dest_lon}",
+        "mode": "driving",
+        "units": units,
+        "key": GOOGLE_API_KEY
+    }
     
     try:
-        response = requests.get(url, timeout=15)
-        data = response.json()
+        response = _session.get(_DIRECTIONS_URL, params=params, timeout=15)
+        data = _decode_response(response)
         
         if data["status"] != "OK":
             error_msg = data.get("error_message", data["status"])
@@ -64,26 +204,7 @@ def get_directions(origin_lat, origin_lon, dest_lat, dest_lon, units="imperial")
         route = data["routes"][0]
         leg = route["legs"][0]
         
-        # Parse steps
-        steps = []
-        for step in leg["steps"]:
-            # Strip HTML tags for clean text
-            instruction = re.sub(r'<[^>]+>', '', step.get("html_instructions", ""))
-            
-            steps.append({
-                "instruction": instruction,
-                "html": step.get("html_instructions", ""),
-                "distance": step["distance"]["text"],
-                "distance_meters": step["distance"]["value"],
-                "duration": step["duration"]["text"],
-                "duration_seconds": step["duration"]["value"],
-                "start_lat": step["start_location"]["lat"],
-                "start_lon": step["start_location"]["lng"],
-                "end_lat": step["end_location"]["lat"],
-                "end_lon": step["end_location"]["lng"],
-                "maneuver": step.get("maneuver", "straight"),
-                "polyline": step.get("polyline", {}).get("points", "")
-            })
+        steps = [_format_step(step) for step in leg["steps"]]
         
         return {
             "ok": True,
@@ -109,6 +230,7 @@ def get_directions(origin_lat, origin_lon, dest_lat, dest_lon, units="imperial")
 # Places API - Nearby Search
 # =============================================================================
 
+@_cached("nearby", lambda lat, lon, place_type, radius=5000: (_coord(lat), _coord(lon), place_type, radius))
 def search_nearby(lat, lon, place_type, radius=5000):
     """
     Search for nearby places using Google Places API.
@@ -122,17 +244,16 @@ def search_nearby(lat, lon, place_type, radius=5000):
     Returns:
         List of places or error
     """
-    url = (
-        f"https://maps.googleapis.com/maps/api/place/nearbysearch/json?"
-        f"location={lat},{lon}&"
-        f"radius={radius}&"
-        f"type={place_type}&"
-        f"key={GOOGLE_API_KEY}"
-    )
+    params = {
+        "location": f"{lat},{lon}",
+        "radius": radius,
+        "type": place_type,
+        "key": GOOGLE_API_KEY
+    }
     
     try:
-        response = requests.get(url, timeout=15)
-        data = response.json()
+        response = _session.get(_NEARBY_SEARCH_URL, params=params, timeout=15)
+        data = _decode_response(response)
         
         if data["status"] not in ["OK", "ZERO_RESULTS"]:
             error_msg = data.get("error_message", data["status"])
@@ -168,6 +289,7 @@ def search_nearby(lat, lon, place_type, radius=5000):
 # Geocoding API - Address to Coordinates
 # =============================================================================
 
+@_cached("geocode", _address_key)
 def geocode(address):
     """
     Convert address to coordinates using Google Geocoding API.
@@ -178,18 +300,11 @@ def geocode(address):
     Returns:
         Dictionary with lat/lon or error
     """
-    from urllib.parse import quote
-    encoded = quote(address)
-    
-    url = (
-        f"https://maps.googleapis.com/maps/api/geocode/json?"
-        f"address={encoded}&"
-        f"key={GOOGLE_API_KEY}"
-    )
+    params = {"address": address, "key": GOOGLE_API_KEY}
     
     try:
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        response = _session.get(_GEOCODE_URL, params=params, timeout=10)
+        data = _decode_response(response)
         
         if data["status"] != "OK":
             error_msg = data.get("error_message", data["status"])
@@ -211,6 +326,8 @@ def geocode(address):
         return {"ok": False, "error": str(e)}
 
 
+# ~11 m is well inside one street address
+@_cached("reverse_geocode", lambda lat, lon: (_coord(lat, 4), _coord(lon, 4)))
 def reverse_geocode(lat, lon):
     """
     Convert coordinates to address using Google Reverse Geocoding.
@@ -222,15 +339,11 @@ def reverse_geocode(lat, lon):
     Returns:
         Dictionary with address or error
     """
-    url = (
-        f"https://maps.googleapis.com/maps/api/geocode/json?"
-        f"latlng={lat},{lon}&"
-        f"key={GOOGLE_API_KEY}"
-    )
+    params = {"latlng": f"{lat},{lon}", "key": GOOGLE_API_KEY}
     
     try:
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        response = _session.get(_GEOCODE_URL, params=params, timeout=10)
+        data = _decode_response(response)
         
         if data["status"] != "OK":
             return {"ok": False, "error": data.get("error_message", data["status"])}
@@ -252,6 +365,7 @@ def reverse_geocode(lat, lon):
 # Place Details API
 # =============================================================================
 
+@_cached("place_details", lambda place_id: place_id)
 def get_place_details(place_id):
     """
     Get detailed information about a place.
@@ -262,16 +376,15 @@ def get_place_details(place_id):
     Returns:
         Dictionary with place details or error
     """
-    url = (
-        f"https://maps.googleapis.com/maps/api/place/details/json?"
-        f"place_id={place_id}&"
-        f"fields=name,formatted_address,formatted_phone_number,opening_hours,website,rating,reviews,price_level,geometry&"
-        f"key={GOOGLE_API_KEY}"
-    )
+    params = {
+        "place_id": place_id,
+        "fields": _PLACE_DETAILS_FIELDS,
+        "key": GOOGLE_API_KEY
+    }
     
     try:
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        response = _session.get(_PLACE_DETAILS_URL, params=params, timeout=10)
+        data = _decode_response(response)
         
         if data["status"] != "OK":
             return {"ok": False, "error": data.get("error_message", data["status"])}
@@ -302,6 +415,7 @@ def get_place_details(place_id):
 # Text Search API - More flexible search
 # =============================================================================
 
+@_cached("text_search", lambda query, lat=None, lon=None, radius=5000: (query, _coord(lat), _coord(lon), radius))
 def search_text(query, lat=None, lon=None, radius=5000):
     """
     Search for places using text query.
@@ -315,17 +429,15 @@ def search_text(query, lat=None, lon=None, radius=5000):
     Returns:
         List of places or error
     """
-    from urllib.parse import quote
-    encoded = quote(query)
-    
-    url = f"https://maps.googleapis.com/maps/api/place/textsearch/json?query={encoded}&key={GOOGLE_API_KEY}"
+    params = {"query": query, "key": GOOGLE_API_KEY}
     
     if lat and lon:
-        url += f"&location={lat},{lon}&radius={radius}"
+        params["location"] = f"{lat},{lon}"
+        params["radius"] = radius
     
     try:
-        response = requests.get(url, timeout=15)
-        data = response.json()
+        response = _session.get(_TEXT_SEARCH_URL, params=params, timeout=15)
+        data = _decode_response(response)
         
         if data["status"] not in ["OK", "ZERO_RESULTS"]:
             return {"ok": False, "error": data.get("error_message", data["status"])}
@@ -364,48 +476,49 @@ def decode_polyline(encoded):
     Returns:
         List of [lat, lon] coordinate pairs
     """
-    points = []
-    index = 0
-    length = len(encoded)
-    lat = 0
-    lng = 0
-    
-    while index < length:
-        # Decode latitude
-        shift = 0
-        result = 0
-        while True:
-            b = ord(encoded[index]) - 63
-            index += 1
-            result |= (b & 0x1f) << shift
-            shift += 5
-            if b < 0x20:
-                break
-        dlat = ~(result >> 1) if result & 1 else result >> 1
-        lat += dlat
-        
-        # Decode longitude
-        shift = 0
-        result = 0
-        while True:
-            b = ord(encoded[index]) - 63
-            index += 1
-            result |= (b & 0x1f) << shift
+    # One pass over the bytes collects every zigzag-decoded delta (lat and lng
+    # alternate), then accumulate() turns the deltas into running positions.
+    # Much less interpreter work per character than the nested loops it replaced.
+    deltas = []
+    result = 0
+    shift = 0
+    for b in encoded.encode("ascii"):
+        b -= 63
+        result |= (b & 0x1f) << shift
+        if b < 0x20:
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+            result = 0
+            shift = 0
+        else:
             shift += 5
-            if b < 0x20:
-                break
-        dlng = ~(result >> 1) if result & 1 else result >> 1
-        lng += dlng
-        
-        points.append([lat / 1e5, lng / 1e5])
     
-    return points
+    return [
+        [lat / 1e5, lng / 1e5]
+        for lat, lng in zip(accumulate(deltas[0::2]), accumulate(deltas[1::2]))
+    ]
 
 
 # =============================================================================
 # Convenience Functions
 # =============================================================================
 
+def get_directions_many(legs, units="imperial"):
+    """
+    Get directions for several legs at once. The calls run in parallel, so
+    a batch takes about as long as its slowest route.
+    
+    Args:
+        legs: Iterable of (origin_lat, origin_lon, dest_lat, dest_lon)
+        units: "imperial" or "metric"
+        
+    Returns:
+        List of get_directions() results, in the same order as legs
+    """
+    return list(_directions_executor.map(
+        lambda leg: get_directions(*leg, units=units), legs
+    ))
+
+
 def route_to_address(origin_lat, origin_lon, destination_address):
     """
     Get directions from coordinates to an address.
@@ -6,13 +6,19 @@ Provides location services for the Raspberry Pi via multiple methods:
 3. IP-based geolocation - fallback (~5km accuracy)
 """
 
+import json
+import socket
+import time
 import requests
 import logging
 from modules import geolocation
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# A WiFi scan plus Google/IP geolocation call is slow and rate-limited, so
+# that answer is reused for this long. GPS is read fresh on every call.
+NETWORK_LOCATION_MAX_AGE = 60.0  # seconds
+
 
 class PiLocation:
     """
@@ -20,7 +26,7 @@ class PiLocation:
     Priority: GPS -> WiFi Geolocation -> IP Geolocation
     """
     
-    # Cached location to avoid repeated API calls
+    # Last WiFi/IP lookup, to avoid repeated scans and API calls
     _cached_location = None
     _cache_time = None
     
@@ -34,26 +40,44 @@ class PiLocation:
         2. WiFi-based Google Geolocation (most accurate without GPS)
         3. IP-based geolocation (fallback)
         
+        GPS is read on every call; the WiFi/IP result is reused for
+        NETWORK_LOCATION_MAX_AGE seconds.
+        
         Returns:
             dict: {lat, lon, accuracy, source} or None if unavailable
         """
         # Try GPS first (if available)
         gps_loc = PiLocation._get_gps_location()
         if gps_loc:
-            logger.info(f"Location from GPS: {gps_loc['lat']}, {gps_loc['lon']}")
             return gps_loc
         
+        now = time.monotonic()
+        if PiLocation._cache_time is not None and now - PiLocation._cache_time < NETWORK_LOCATION_MAX_AGE:
+            return PiLocation._cached_location
+        
+        PiLocation._cached_location = PiLocation._get_network_location()
+        PiLocation._cache_time = now
+        return PiLocation._cached_location
+    
+    @staticmethod
+    def _get_network_location():
+        """
+        Look the Pi up by WiFi scan, falling back to IP geolocation (uncached).
+        
+        Returns:
+            dict: {lat, lon, accuracy, source} or None if unavailable
+        """
         # Try WiFi-based Google Geolocation (primary method)
         wifi_loc = PiLocation._get_wifi_location()
         if wifi_loc:
-            logger.info(f"Location from WiFi: {wifi_loc['lat']}, {wifi_loc['lon']} (±{wifi_loc.get('accuracy', '?')}m)")
+            logger.info("Location from WiFi: %s, %s (±%sm)", wifi_loc['lat'], wifi_loc['lon'], wifi_loc.get('accuracy', '?'))
             return wifi_loc
         
         # Fallback to IP-based geolocation
         logger.warning("WiFi geolocation failed, falling back to IP geolocation")
         ip_loc = PiLocation._get_ip_location()
         if ip_loc:
-            logger.info(f"Location from IP: {ip_loc['lat']}, {ip_loc['lon']} (fallback)")
+            logger.info("Location from IP: %s, %s (fallback)", ip_loc['lat'], ip_loc['lon'])
             return ip_loc
         
         logger.error("All location methods failed")
@@ -71,8 +95,8 @@ class PiLocation:
             result = geolocation.get_accurate_location()
             
             if result.get('ok'):
-                logger.debug(f"WiFi scan found {result.get('wifi_count', 0)} networks")
-                logger.debug(f"Google Geolocation accuracy: {result.get('accuracy')}m")
+                logger.debug("WiFi scan found %s networks", result.get('wifi_count', 0))
+                logger.debug("Google Geolocation accuracy: %sm", result.get('accuracy'))
                 return {
                     'lat': result['lat'],
                     'lon': result['lon'],
@@ -81,11 +105,11 @@ class PiLocation:
                     'wifi_count': result.get('wifi_count', 0)
                 }
             else:
-                logger.warning(f"WiFi geolocation failed: {result.get('error')}")
+                logger.warning("WiFi geolocation failed: %s", result.get('error'))
                 return None
                 
         except Exception as e:
-            logger.error(f"WiFi geolocation exception: {e}")
+            logger.error("WiFi geolocation exception: %s", e)
             return None
     
     @staticmethod
@@ -98,8 +122,6 @@ class PiLocation:
         """
         try:
             # Try to connect to gpsd (GPS daemon)
-            import socket
-            
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(2)
             sock.connect(("localhost", 2947))
@@ -110,13 +132,12 @@ class PiLocation:
             sock.close()
             
             # Parse GPS data
-            import json
             for line in data.split('\n'):
                 if line.strip():
                     try:
                         obj = json.loads(line)
                         if obj.get('class') == 'TPV' and 'lat' in obj and 'lon' in obj:
-                            logger.debug(f"GPS location: {obj['lat']}, {obj['lon']}")
+                            logger.debug("GPS location: %s, %s", obj['lat'], obj['lon'])
                             return {
                                 'lat': obj['lat'],
                                 'lon': obj['lon'],
@@ -129,7 +150,7 @@ class PiLocation:
             return None
             
         except Exception as e:
-            logger.debug(f"GPS not available: {e}")
+            logger.debug("GPS not available: %s", e)
             return None
     
     @staticmethod
@@ -153,7 +174,7 @@ class PiLocation:
             data = response.json()
             
             if data.get('status') == 'success':
-                logger.debug(f"IP location: {data['lat']}, {data['lon']} ({data.get('city', 'Unknown')})")
+                logger.debug("IP location: %s, %s (%s)", data['lat'], data['lon'], data.get('city', 'Unknown'))
                 return {
                     'lat': data['lat'],
                     'lon': data['lon'],
@@ -164,11 +185,11 @@ class PiLocation:
                     'source': 'ip_fallback'
                 }
             
-            logger.warning(f"IP geolocation failed: {data.get('message', 'unknown error')}")
+            logger.warning("IP geolocation failed: %s", data.get('message', 'unknown error'))
             return None
             
         except Exception as e:
-            logger.error(f"IP geolocation exception: {e}")
+            logger.error("IP geolocation exception: %s", e)
             return None
     
     @staticmethod
@@ -187,7 +208,7 @@ class PiLocation:
         if loc:
             return loc
         
-        logger.warning(f"Using default location: {default_lat}, {default_lon}")
+        logger.warning("Using default location: %s, %s", default_lat, default_lon)
         return {
             'lat': default_lat,
             'lon': default_lon,
@@ -6,15 +6,27 @@ Supports both coordinate input and street address geocoding
 
 import folium
 import json
+import math
 import os
 import re
 import ssl
+import urllib.parse
 import certifi
 import requests
 import logging
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+# orjson parses large route geometries much faster than the stdlib (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# HTML tags in Google Directions step instructions
+_HTML_TAG_RE = re.compile('<[^<]+?>')
+
 # Import config for API keys
 try:
     import sys
@@ -25,8 +37,6 @@ except ImportError:
     USE_GOOGLE_MAPS = False
     USE_OSRM_FALLBACK = True
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 class MapManager:
     def __init__(self):
@@ -88,7 +98,6 @@ class MapManager:
         
         # Fallback: direct Nominatim HTTP request
         try:
-            import urllib.parse
             encoded_text = urllib.parse.quote(text)
             url = f"https://nominatim.openstreetmap.org/search?format=json&q={encoded_text}"
             headers = {"User-Agent": "car_stereo_system_v1"}
@@ -114,7 +123,6 @@ class MapManager:
             Tuple of (latitude, longitude) or None if failed
         """
         try:
-            import urllib.parse
             encoded_address = urllib.parse.quote(address)
             url = f"https://maps.googleapis.com/maps/api/geocode/json?address={encoded_address}&key={GOOGLE_MAPS_API_KEY}"
             
@@ -312,8 +320,7 @@ class MapManager:
             steps = []
             for step in leg.get('steps', []):
                 # Strip HTML tags from instructions
-                import re
-                instruction = re.sub('<[^<]+?>', '', step.get('html_instructions', ''))
+                instruction = _HTML_TAG_RE.sub('', step.get('html_instructions', ''))
                 
                 start_loc = step.get('start_location', {})
                 
@@ -415,7 +422,8 @@ class MapManager:
             response = requests.get(url, params=params, timeout=15, headers={
                 'User-Agent': 'car_stereo_system_v1'
             })
-            data = response.json()
+            # Full geometry plus annotations makes this a large response
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             if data.get('code') != 'Ok' or not data.get('routes'):
                 print(f"OSRM error: {data.get('code', 'Unknown')}")
@@ -542,8 +550,6 @@ class MapManager:
         Returns:
             Distance in miles
         """
-        import math
-        
         lat1, lon1 = coord1
         lat2, lon2 = coord2
         
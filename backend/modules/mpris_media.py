@@ -0,0 +1,307 @@
+"""
+MPRIS Media Module
+In-process MPRIS (org.mpris.MediaPlayer2) media control over the D-Bus session bus.
+Does the same job as playerctl without forking a process for every command.
+
+Once start_mpris_watch() is running, the active player and its metadata are
+cached until a PropertiesChanged or NameOwnerChanged signal says otherwise.
+"""
+
+import logging
+import time
+
+from .dbus_loop import GLIB_LOOP_AVAILABLE, start_glib_loop
+
+# Try to import dbus (only available on Linux)
+try:
+    import dbus
+    DBUS_AVAILABLE = True
+except ImportError:
+    DBUS_AVAILABLE = False
+    logging.warning("dbus-python not installed. MPRIS media control unavailable.")
+    logging.warning("  Install with: pip install dbus-python")
+
+# MPRIS D-Bus constants
+MPRIS_BUS_PREFIX = "org.mpris.MediaPlayer2."
+MPRIS_OBJECT_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+DBUS_PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
+DBUS_SERVICE = "org.freedesktop.DBus"
+DBUS_PATH = "/org/freedesktop/DBus"
+
+# Without signals, cache the active player's bus name so a burst of UI taps
+# reuses one ListNames
+PLAYER_CACHE_TTL = 2.0  # seconds
+# Don't retry a session bus that isn't there more often than this
+BUS_RETRY_INTERVAL = 30.0  # seconds
+
+_bus_cache = {"bus": None, "failed_ts": None}
+_player_cache = {"name": None, "ts": 0.0, "generation": -1}
+_metadata_cache = {"value": None, "generation": -1}
+# "generation" is bumped by every change signal. A cache entry is only valid
+# for the generation it was fetched in, so a lookup that races with a change
+# never gets cached as current.
+_watch = {"active": False, "generation": 0}
+# Callbacks run (on the GLib thread) when an MPRIS player appears or leaves
+_player_change_listeners = []
+# Callbacks run (on the GLib thread) when playback status or track may have changed
+_media_change_listeners = []
+
+
+def get_session_bus():
+    """
+    Get the long-lived session bus connection, connecting on first use.
+
+    Returns:
+        dbus.SessionBus or None if there is no session bus to connect to
+    """
+    if not DBUS_AVAILABLE:
+        return None
+    if _bus_cache["bus"] is not None:
+        return _bus_cache["bus"]
+
+    failed_ts = _bus_cache["failed_ts"]
+    if failed_ts is not None and time.monotonic() - failed_ts < BUS_RETRY_INTERVAL:
+        return None
+
+    try:
+        _bus_cache["bus"] = dbus.SessionBus()
+        _bus_cache["failed_ts"] = None
+    except dbus.exceptions.DBusException as e:
+        logging.debug("No D-Bus session bus for MPRIS: %s", e)
+        _bus_cache["failed_ts"] = time.monotonic()
+    return _bus_cache["bus"]
+
+
+def invalidate_mpris_player():
+    """Force the next lookup to list bus names and fetch metadata again."""
+    _player_cache["ts"] = 0.0
+    _watch["generation"] += 1
+
+
+def _notify(listeners):
+    for callback in listeners:
+        try:
+            callback()
+        except Exception as e:
+            logging.debug("MPRIS listener error: %s", e)
+
+
+def _on_properties_changed(interface, changed, invalidated):
+    """PropertiesChanged on /org/mpris/MediaPlayer2: playback or track changed."""
+    if interface == MPRIS_PLAYER_IFACE:
+        _watch["generation"] += 1
+        _notify(_media_change_listeners)
+
+
+def _on_name_owner_changed(name, old_owner, new_owner):
+    """NameOwnerChanged: a player appeared on or left the bus."""
+    if name.startswith(MPRIS_BUS_PREFIX):
+        logging.debug("MPRIS player %s: %s", "appeared" if new_owner else "left", name)
+        invalidate_mpris_player()
+        _notify(_player_change_listeners)
+        _notify(_media_change_listeners)
+
+
+def add_player_change_listener(callback):
+    """Call callback() whenever an MPRIS player appears on or leaves the bus."""
+    _player_change_listeners.append(callback)
+
+
+def add_media_change_listener(callback):
+    """Call callback() whenever the active player's status or track may have changed."""
+    _media_change_listeners.append(callback)
+
+
+def start_mpris_watch():
+    """
+    Subscribe to MPRIS change signals on the shared GLib main loop so the
+    player and metadata lookups can be cached between changes.
+
+    Returns:
+        bool: True if signals are being watched
+    """
+    if _watch["active"]:
+        return True
+    if not (DBUS_AVAILABLE and GLIB_LOOP_AVAILABLE):
+        return False
+
+    bus = get_session_bus()
+    if bus is None:
+        return False
+
+    try:
+        bus.add_signal_receiver(
+            _on_properties_changed,
+            dbus_interface=DBUS_PROPERTIES_IFACE,
+            signal_name="PropertiesChanged",
+            path=MPRIS_OBJECT_PATH
+        )
+        bus.add_signal_receiver(
+            _on_name_owner_changed,
+            dbus_interface=DBUS_SERVICE,
+            signal_name="NameOwnerChanged",
+            bus_name=DBUS_SERVICE,
+            path=DBUS_PATH
+        )
+    except dbus.exceptions.DBusException as e:
+        logging.debug("Could not subscribe to MPRIS signals: %s", e)
+        return False
+
+    start_glib_loop()
+    invalidate_mpris_player()
+    _watch["active"] = True
+    logging.info("Watching MPRIS players for changes")
+    return True
+
+
+def find_mpris_player():
+    """
+    Find the active MPRIS player on the session bus, preferring Bluetooth
+    players. The result is cached until the next change signal, or for
+    PLAYER_CACHE_TTL seconds when signals aren't being watched.
+
+    Returns:
+        str or None: The player's bus name (e.g. 'org.mpris.MediaPlayer2.bluez_proxy')
+    """
+    now = time.monotonic()
+    generation = _watch["generation"]
+    if _watch["active"]:
+        if _player_cache["generation"] == generation:
+            return _player_cache["name"]
+    elif now - _player_cache["ts"] < PLAYER_CACHE_TTL:
+        return _player_cache["name"]
+
+    bus = get_session_bus()
+    if bus is None:
+        return None
+
+    player = None
+    try:
+        names = [str(n) for n in bus.list_names() if str(n).startswith(MPRIS_BUS_PREFIX)]
+        for name in names:
+            if 'bluez' in name.lower() or 'bluetooth' in name.lower():
+                player = name
+                break
+        else:
+            player = names[0] if names else None
+        logging.debug("Active MPRIS player: %s", player)
+    except dbus.exceptions.DBusException as e:
+        logging.debug("D-Bus error listing MPRIS players: %s", e)
+
+    _player_cache["name"] = player
+    _player_cache["ts"] = now
+    _player_cache["generation"] = generation
+    return player
+
+
+def run_mpris_command(cmd):
+    """
+    Run a command on the active player's org.mpris.MediaPlayer2.Player interface.
+
+    Args:
+        cmd: Method name - 'Play', 'Pause', 'PlayPause', 'Next', 'Previous', 'Stop'
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    if not DBUS_AVAILABLE:
+        return False, "dbus-python not installed"
+
+    player = find_mpris_player()
+    if not player:
+        return False, "No MPRIS media player found"
+
+    try:
+        # The interface is always given explicitly, so skip the Introspect round trip
+        obj = get_session_bus().get_object(player, MPRIS_OBJECT_PATH, introspect=False)
+        obj.get_dbus_method(cmd, MPRIS_PLAYER_IFACE)()
+        logging.debug("MPRIS command '%s' sent to %s", cmd, player)
+        return True, f"{cmd} OK"
+    except dbus.exceptions.DBusException as e:
+        logging.debug("D-Bus error executing MPRIS %s: %s", cmd, e)
+        # The player may have gone away; look it up again next time
+        invalidate_mpris_player()
+        return False, f"D-Bus error: {e}"
+    except Exception as e:
+        logging.debug("Error executing MPRIS %s: %s", cmd, e)
+        return False, str(e)
+
+
+def toggle_mpris_playback():
+    """
+    Toggle play/pause with a single PlayPause call. Players that don't
+    implement PlayPause get Play or Pause based on their (cached) status.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    ok, msg = run_mpris_command("PlayPause")
+    if ok or ("UnknownMethod" not in msg and "NotSupported" not in msg):
+        return ok, msg
+
+    metadata = get_mpris_metadata()
+    if not metadata:
+        return False, msg
+    return run_mpris_command("Pause" if metadata["is_playing"] else "Play")
+
+
+def get_mpris_metadata():
+    """
+    Get playback status and track metadata from the active MPRIS player with
+    a single Properties.GetAll call. While signals are being watched the
+    result is reused until the player reports a change.
+
+    Returns:
+        dict or None: Dictionary with 'status', 'title', 'artist', 'album',
+        'is_playing' and 'player' keys
+    """
+    if not DBUS_AVAILABLE:
+        return None
+
+    generation = _watch["generation"]
+    if _watch["active"] and _metadata_cache["generation"] == generation:
+        return _metadata_cache["value"]
+
+    metadata = _fetch_mpris_metadata(find_mpris_player())
+    if _watch["active"]:
+        _metadata_cache["value"] = metadata
+        _metadata_cache["generation"] = generation
+    return metadata
+
+
+def _fetch_mpris_metadata(player):
+    """GetAll on the given player's Player interface (uncached)."""
+    if not player:
+        return None
+
+    try:
+        obj = get_session_bus().get_object(player, MPRIS_OBJECT_PATH, introspect=False)
+        props = dbus.Interface(obj, DBUS_PROPERTIES_IFACE).GetAll(MPRIS_PLAYER_IFACE)
+
+        status = str(props.get("PlaybackStatus", "Unknown"))
+        metadata = props.get("Metadata", {})
+        # xesam:artist should be a list, but some players send a plain string
+        artist = metadata.get("xesam:artist", [])
+        if isinstance(artist, str):
+            artist = [artist]
+        artist = ", ".join(str(a) for a in artist)
+        title = str(metadata.get("xesam:title", ""))
+        album = str(metadata.get("xesam:album", ""))
+
+        return {
+            "status": status,
+            "title": title,
+            "artist": artist,
+            "album": album,
+            "is_playing": status.lower() == "playing",
+            "player": player.replace(MPRIS_BUS_PREFIX, "", 1)
+        }
+
+    except dbus.exceptions.DBusException as e:
+        logging.debug("D-Bus error getting MPRIS metadata: %s", e)
+        invalidate_mpris_player()
+        return None
+    except Exception as e:
+        logging.debug("Error getting MPRIS metadata: %s", e)
+        return None
@@ -5,13 +5,41 @@ Supports Spotify integration (optional)
 """
 
 import subprocess
+import logging
 import os
+import shutil
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Set volume through the ALSA mixer in-process when pyalsaaudio is installed,
+# instead of forking pactl for every change
+try:
+    import alsaaudio
+    ALSAAUDIO_AVAILABLE = True
+except ImportError:
+    ALSAAUDIO_AVAILABLE = False
+    print("Warning: pyalsaaudio is not installed. Volume changes will use pactl.")
+    print("  Install with: pip install pyalsaaudio")
+
+# Volume changes arriving within this window (a slider drag) are coalesced
+# and only the last value is applied
+VOLUME_DEBOUNCE = 0.05  # seconds
+# pactl answers in milliseconds; one that takes longer is stuck, and would
+# hold up every volume change queued behind it
+PACTL_TIMEOUT = 1.0  # seconds
 
 class MusicManager:
     def __init__(self):
         self.is_playing = False
         self.current_volume = 50
         self.player_process = None
+        self._mixer = None
+        self._pactl = None
+        self._pending_volume = None
+        self._volume_cond = threading.Condition()
+        self._volume_thread = None
         
         # Try to initialize audio system
         self._init_audio()
@@ -21,9 +49,20 @@ class MusicManager:
         try:
             # Set default audio sink (for Bluetooth or local audio)
             # This may need adjustment based on your audio setup
-            subprocess.run(['pactl', 'set-default-sink', '0'], check=False)
+            subprocess.run(['pactl', 'set-default-sink', '0'], check=False, timeout=PACTL_TIMEOUT)
         except Exception as e:
             print(f"Audio init warning: {e}")
+        
+        if ALSAAUDIO_AVAILABLE:
+            try:
+                self._mixer = alsaaudio.Mixer('Master')
+            except alsaaudio.ALSAAudioError as e:
+                print(f"ALSA mixer unavailable, volume changes will use pactl: {e}")
+        
+        if not self._mixer:
+            self._pactl = shutil.which('pactl')
+            if not self._pactl:
+                print("Warning: no ALSA mixer or pactl found. Volume control unavailable.")
     
     def play(self, source='bluetooth'):
         """Start music playback"""
@@ -65,24 +104,67 @@ class MusicManager:
             return {'success': False, 'message': str(e)}
     
     def set_volume(self, volume):
-        """Set volume level (0-100)"""
+        """
+        Set volume level (0-100).
+        The mixer is updated by a background thread, so a burst of calls only
+        applies the last value.
+        """
+        if not self._mixer and not self._pactl:
+            return {'success': False, 'message': 'No volume control available (no ALSA mixer or pactl)'}
+        
         try:
-            volume = max(0, min(100, volume))
+            volume = max(0, min(100, int(volume)))
             self.current_volume = volume
             
+            with self._volume_cond:
+                self._pending_volume = volume
+                if self._volume_thread is None:
+                    self._volume_thread = threading.Thread(target=self._volume_worker, daemon=True)
+                    self._volume_thread.start()
+                self._volume_cond.notify()
+            
+            return {'success': True, 'message': f'Volume set to {volume}%'}
+        except Exception as e:
+            print(f"Volume set error: {e}")
+            return {'success': False, 'message': str(e)}
+    
+    def _volume_worker(self):
+        """Background thread: apply the latest requested volume"""
+        while True:
+            with self._volume_cond:
+                while self._pending_volume is None:
+                    self._volume_cond.wait()
+            
+            # Let the rest of a slider drag arrive
+            time.sleep(VOLUME_DEBOUNCE)
+            
+            with self._volume_cond:
+                volume = self._pending_volume
+                self._pending_volume = None
+            self._apply_volume(volume)
+    
+    def _apply_volume(self, volume):
+        """Write a volume level (0-100) to the mixer"""
+        try:
+            if self._mixer:
+                self._mixer.setvolume(volume)
+                return
+            
             # Convert to pulseaudio volume (0-65536)
             pa_volume = int((volume / 100) * 65536)
             
             # Set volume using pactl
             subprocess.run(
-                ['pactl', 'set-sink-volume', '@DEFAULT_SINK@', str(pa_volume)],
-                check=False
+                [self._pactl, 'set-sink-volume', '@DEFAULT_SINK@', str(pa_volume)],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=PACTL_TIMEOUT
             )
-            
-            return {'success': True, 'message': f'Volume set to {volume}%'}
+        except subprocess.CalledProcessError as e:
+            logger.warning("pactl failed to set volume to %s%%: %s", volume, (e.stderr or b"").decode(errors="replace").strip())
         except Exception as e:
-            print(f"Volume set error: {e}")
-            return {'success': False, 'message': str(e)}
+            logger.warning("Volume set error: %s", e)
     
     def get_current_track(self):
         """Get information about currently playing track"""
@@ -13,8 +13,6 @@ import time
 import asyncio
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # Import BluetoothManager for device type detection
 try:
     from modules.bluetooth_module import BluetoothManager, BLEAK_AVAILABLE
@@ -80,7 +78,7 @@ class PhoneLocation:
         # Check if location is fresh enough
         age = time.time() - cls.last_ios_timestamp
         if age > cls.LOCATION_EXPIRY:
-            logging.debug(f"iOS location is stale ({age:.0f}s old)")
+            logging.debug("iOS location is stale (%.0fs old)", age)
             return None
         
         return {
@@ -127,7 +125,7 @@ class PhoneLocation:
                         'source': 'android_ble'
                     }
             except Exception as e:
-                logging.debug(f"Android BLE location read failed: {e}")
+                logging.debug("Android BLE location read failed: %s", e)
         
         return None
     
@@ -171,10 +169,10 @@ class PhoneLocation:
                                 'timestamp': time.time()
                             }
                 except Exception as e:
-                    logging.debug(f"Could not read Android location characteristic: {e}")
+                    logging.debug("Could not read Android location characteristic: %s", e)
                 
         except Exception as e:
-            logging.debug(f"Android BLE connection failed: {e}")
+            logging.debug("Android BLE connection failed: %s", e)
         
         return None
     
@@ -196,7 +194,8 @@ class PhoneLocation:
             'timestamp': timestamp or time.strftime('%Y-%m-%dT%H:%M:%SZ')
         }
         cls.last_ios_timestamp = time.time()
-        logging.info(f"Updated iOS location: {lat}, {lon}")
+        # Posted about once a second while the bridge page is open
+        logging.debug("Updated iOS location: %s, %s", lat, lon)
     
     @classmethod
     def update_android_location(cls, lat, lon, accuracy=None, timestamp=None):
@@ -216,7 +215,7 @@ class PhoneLocation:
             'timestamp': timestamp or time.strftime('%Y-%m-%dT%H:%M:%SZ')
         }
         cls.last_android_timestamp = time.time()
-        logging.info(f"Updated Android location: {lat}, {lon}")
+        logging.info("Updated Android location: %s, %s", lat, lon)
     
     @classmethod
     def get_status(cls):
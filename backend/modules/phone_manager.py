@@ -11,7 +11,6 @@ import time
 import platform
 import queue
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # Check if we're on Linux (Raspberry Pi)
@@ -22,19 +21,14 @@ DBUS_AVAILABLE = False
 if IS_LINUX:
     try:
         import dbus
-        import dbus.mainloop.glib
         DBUS_AVAILABLE = True
     except ImportError:
         logger.warning("dbus-python not available. Phone features will be limited.")
 
-# Try to import GLib for main loop
-GLIB_AVAILABLE = False
-if IS_LINUX:
-    try:
-        from gi.repository import GLib
-        GLIB_AVAILABLE = True
-    except ImportError:
-        logger.warning("GLib not available. Phone event streaming will use polling.")
+# GLib main loop for D-Bus signals (shared with other modules)
+from .dbus_loop import GLIB_LOOP_AVAILABLE as GLIB_AVAILABLE, start_glib_loop
+if IS_LINUX and not GLIB_AVAILABLE:
+    logger.warning("GLib not available. Phone event streaming will use polling.")
 
 
 class PhoneManager:
@@ -52,8 +46,7 @@ class PhoneManager:
         self.listeners = []
         self.event_queue = queue.Queue()
         self.running = False
-        self._loop = None
-        self._loop_thread = None
+        self._signal_matches = []
         self._poll_thread = None
         self._bus = None
         self.recent_calls = []
@@ -81,61 +74,50 @@ class PhoneManager:
     def stop(self):
         """Stop the phone manager."""
         self.running = False
-        if self._loop:
-            self._loop.quit()
-        if self._loop_thread:
-            self._loop_thread.join(timeout=2)
+        # The GLib loop is shared, so just stop receiving our signals
+        for match in self._signal_matches:
+            match.remove()
+        self._signal_matches = []
         logger.info("PhoneManager stopped")
     
     def _start_dbus_listener(self):
         """Start D-Bus signal listener for BlueZ HFP events."""
         try:
-            dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
             self._bus = dbus.SystemBus()
             
-            # Listen for property changes on all BlueZ objects
-            self._bus.add_signal_receiver(
-                self._handle_properties_changed,
-                dbus_interface="org.freedesktop.DBus.Properties",
-                signal_name="PropertiesChanged",
-                path_keyword="path"
-            )
-            
-            # Listen for new interfaces (new calls)
-            self._bus.add_signal_receiver(
-                self._handle_interfaces_added,
-                dbus_interface="org.freedesktop.DBus.ObjectManager",
-                signal_name="InterfacesAdded"
-            )
-            
-            # Listen for removed interfaces (call ended)
-            self._bus.add_signal_receiver(
-                self._handle_interfaces_removed,
-                dbus_interface="org.freedesktop.DBus.ObjectManager",
-                signal_name="InterfacesRemoved"
-            )
+            self._signal_matches = [
+                # Listen for property changes on all BlueZ objects
+                self._bus.add_signal_receiver(
+                    self._handle_properties_changed,
+                    dbus_interface="org.freedesktop.DBus.Properties",
+                    signal_name="PropertiesChanged",
+                    path_keyword="path"
+                ),
+                # Listen for new interfaces (new calls)
+                self._bus.add_signal_receiver(
+                    self._handle_interfaces_added,
+                    dbus_interface="org.freedesktop.DBus.ObjectManager",
+                    signal_name="InterfacesAdded"
+                ),
+                # Listen for removed interfaces (call ended)
+                self._bus.add_signal_receiver(
+                    self._handle_interfaces_removed,
+                    dbus_interface="org.freedesktop.DBus.ObjectManager",
+                    signal_name="InterfacesRemoved"
+                ),
+            ]
             
             # Get initial connected device
             self._check_connected_devices()
             
-            # Start GLib main loop in thread
-            self._loop_thread = threading.Thread(target=self._run_glib_loop, daemon=True)
-            self._loop_thread.start()
+            # Start the shared GLib main loop thread
+            start_glib_loop()
             
             logger.info("D-Bus listeners registered for BlueZ HFP")
             
         except Exception as e:
             logger.error(f"Failed to start D-Bus listener: {e}")
     
-    def _run_glib_loop(self):
-        """Run GLib main loop for D-Bus events."""
-        try:
-            self._loop = GLib.MainLoop()
-            logger.info("GLib main loop starting...")
-            self._loop.run()
-        except Exception as e:
-            logger.error(f"GLib loop error: {e}")
-    
     def _handle_properties_changed(self, interface, changed, invalidated, path=None):
         """Handle D-Bus property change signals from BlueZ."""
         try:
@@ -351,7 +333,7 @@ class PhoneManager:
         # Add to event queue for SSE
         try:
             self.event_queue.put_nowait(data)
-        except:
+        except queue.Full:
             pass
         
         # Call direct listeners
@@ -10,8 +10,18 @@ except ImportError:
     SENSE_HAT_AVAILABLE = False
     print("Warning: Sense HAT not available. Running in simulation mode.")
 
+OFF = (0, 0, 0)
+
+# Fixed LED patterns as 64-pixel frames (row-major, x = column)
+# Music: alternating colors
+MUSIC_FRAME = [(0, 100, 200) if (x + y) % 2 == 0 else OFF for y in range(8) for x in range(8)]
+# Bluetooth: left half blue
+BLUETOOTH_FRAME = [(0, 0, 200) if x < 4 else OFF for y in range(8) for x in range(8)]
+
 class SenseHATManager:
     def __init__(self):
+        # Last frame written to the LED matrix, so unchanged frames are skipped
+        self._last_frame = None
         if SENSE_HAT_AVAILABLE:
             self.sense = SenseHat()
             self.sense.clear()
@@ -46,35 +56,31 @@ class SenseHATManager:
             }
     
     def update_display(self, system_state):
-        """Update LED display based on system state"""
+        """
+        Update LED display based on system state.
+        The frame is written in one set_pixels() call, and only if it differs
+        from what is already on the matrix.
+        """
         if not SENSE_HAT_AVAILABLE or not self.sense:
             return
         
         try:
             # Show different patterns based on system state
             if system_state.get('music_playing'):
-                # Show music note pattern (simple animation)
-                self.sense.clear()
-                # Simple pattern: alternating colors
-                for x in range(8):
-                    for y in range(8):
-                        if (x + y) % 2 == 0:
-                            self.sense.set_pixel(x, y, 0, 100, 200)
+                frame = MUSIC_FRAME
             elif system_state.get('bluetooth_connected'):
-                # Show Bluetooth symbol pattern
-                self.sense.clear()
-                # Blue pattern
-                for x in range(8):
-                    for y in range(8):
-                        if x < 4:
-                            self.sense.set_pixel(x, y, 0, 0, 200)
+                frame = BLUETOOTH_FRAME
             else:
                 # Default: show temperature gradient
-                temp = self.get_sensor_data()['temperature']
+                temp = self.sense.get_temperature()
                 # Map temperature to color (blue=cold, red=hot)
                 r = min(255, max(0, int((temp - 15) * 10)))
                 b = min(255, max(0, int((35 - temp) * 10)))
-                self.sense.clear(r, 0, b)
+                frame = [(r, 0, b)] * 64
+            
+            if frame != self._last_frame:
+                self.sense.set_pixels(frame)
+                self._last_frame = frame
         except Exception as e:
             print(f"Error updating display: {e}")
     
@@ -86,6 +92,8 @@ class SenseHATManager:
         
         try:
             self.sense.show_message(message, scroll_speed=scroll_speed)
+            # The message left the matrix in an unknown state; redraw next time
+            self._last_frame = None
         except Exception as e:
             print(f"Error showing message: {e}")
 
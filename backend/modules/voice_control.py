@@ -15,8 +15,6 @@ except ImportError:
     sr = None
     logging.warning("SpeechRecognition not available. Voice control disabled.")
 
-logging.basicConfig(level=logging.DEBUG)
-
 class VoiceController:
     def __init__(self, api_base_url="http://localhost:5000"):
         if not SPEECH_RECOGNITION_AVAILABLE:
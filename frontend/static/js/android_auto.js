@@ -76,9 +76,8 @@ function updateUI() {
 // Check status on load
 async function checkStatus() {
     try {
-        const response = await fetch('/api/status');
-        const data = await response.json();
-        // You might want to add Android Auto status to the API response
+        // Only needs to know the server is up; /api/status is for real state
+        await fetch('/healthz');
         updateUI();
     } catch (error) {
         console.error('Error checking status:', error);
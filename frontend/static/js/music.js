@@ -6,6 +6,7 @@ let currentVolume = 50;
 let connectedDeviceAddress = null;
 let connectedDeviceName = null;
 let statusPollInterval = null;
+let mediaEventSource = null;
 
 // =============================================================================
 // Media Control Buttons
@@ -135,48 +136,51 @@ async function fetchMediaStatus() {
     try {
         const response = await fetch('/api/media/status');
         const data = await response.json();
+        applyMediaStatus(data);
+    } catch (error) {
+        console.error('Error fetching media status:', error);
+        updateConnectionStatus(false);
+    }
+}
+
+function applyMediaStatus(data) {
+    // Determine if we have an active media player
+    const hasActivePlayer = data && data.ok && data.status !== 'no-player';
+    
+    if (hasActivePlayer) {
+        isPlaying = data.is_playing;
         
-        // Determine if we have an active media player
-        const hasActivePlayer = data && data.ok && data.status !== 'no-player';
+        // Update play/pause button icon
+        const playIcon = document.getElementById('play-icon');
+        if (playIcon) {
+            playIcon.textContent = isPlaying ? 'PAUSE' : 'PLAY';
+        } else if (playPauseBtn) {
+            playPauseBtn.textContent = isPlaying ? 'PAUSE' : 'PLAY';
+        }
         
-        if (hasActivePlayer) {
-            isPlaying = data.is_playing;
-            
-            // Update play/pause button icon
-            const playIcon = document.getElementById('play-icon');
-            if (playIcon) {
-                playIcon.textContent = isPlaying ? 'PAUSE' : 'PLAY';
-            } else if (playPauseBtn) {
-                playPauseBtn.textContent = isPlaying ? 'PAUSE' : 'PLAY';
-            }
-            
-            // Update track info
-            if (data.title || data.artist) {
-                updateTrackInfo(
-                    data.title || 'Unknown Track',
-                    data.artist || 'Unknown Artist'
-                );
-            } else if (data.status === 'Playing' || data.status === 'Paused') {
-                updateTrackInfo(data.status, connectedDeviceName || 'Bluetooth Audio');
-            }
-            
-            // Update connection indicator to show connected (media player is active)
-            updateConnectionStatus(true, data.source === 'bluez' ? 'Bluetooth Audio' : 'Media Player');
-            
-        } else {
-            // No media player available
-            const playIcon = document.getElementById('play-icon');
-            if (playIcon) {
-                playIcon.textContent = 'PLAY';
-            } else if (playPauseBtn) {
-                playPauseBtn.textContent = 'PLAY';
-            }
-            
-            // Update connection indicator to show not connected
-            updateConnectionStatus(false);
+        // Update track info
+        if (data.title || data.artist) {
+            updateTrackInfo(
+                data.title || 'Unknown Track',
+                data.artist || 'Unknown Artist'
+            );
+        } else if (data.status === 'Playing' || data.status === 'Paused') {
+            updateTrackInfo(data.status, connectedDeviceName || 'Bluetooth Audio');
         }
-    } catch (error) {
-        console.error('Error fetching media status:', error);
+        
+        // Update connection indicator to show connected (media player is active)
+        updateConnectionStatus(true, data.source === 'bluez' ? 'Bluetooth Audio' : 'Media Player');
+        
+    } else {
+        // No media player available
+        const playIcon = document.getElementById('play-icon');
+        if (playIcon) {
+            playIcon.textContent = 'PLAY';
+        } else if (playPauseBtn) {
+            playPauseBtn.textContent = 'PLAY';
+        }
+        
+        // Update connection indicator to show not connected
         updateConnectionStatus(false);
     }
 }
@@ -212,6 +216,10 @@ async function scanBluetoothDevices() {
         const data = await response.json();
         
         displayDevices(data.devices || []);
+        // Cached results were returned while a new scan runs; pick it up shortly
+        if (data.scanning) {
+            setTimeout(scanBluetoothDevices, 3000);
+        }
     } catch (error) {
         console.error('Error scanning devices:', error);
         displayDevices([]);
@@ -398,10 +406,24 @@ window.disconnectDevice = disconnectDevice;
 // =============================================================================
 
 function startMediaStatusPolling() {
-    // Poll every 2 seconds
-    if (statusPollInterval) {
-        clearInterval(statusPollInterval);
+    stopMediaStatusPolling();
+    
+    // Prefer server-sent events: the server pushes status only when it changes
+    if (window.EventSource) {
+        mediaEventSource = new EventSource('/api/media/events');
+        mediaEventSource.onmessage = (e) => {
+            try {
+                applyMediaStatus(JSON.parse(e.data));
+            } catch (err) {
+                console.error('Error parsing media event:', err);
+            }
+        };
+        // EventSource reconnects by itself after an error
+        mediaEventSource.onerror = () => updateConnectionStatus(false);
+        return;
     }
+    
+    // Otherwise poll every 2 seconds
     statusPollInterval = setInterval(fetchMediaStatus, 2000);
     
     // Fetch immediately
@@ -409,6 +431,10 @@ function startMediaStatusPolling() {
 }
 
 function stopMediaStatusPolling() {
+    if (mediaEventSource) {
+        mediaEventSource.close();
+        mediaEventSource = null;
+    }
     if (statusPollInterval) {
         clearInterval(statusPollInterval);
         statusPollInterval = null;
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for the car stereo backend.
+
+Usage (from the repository root):
+    gunicorn -c gunicorn.conf.py backend.app:app
+
+Runs a single worker process with a thread pool. App state (system_state,
+media/status snapshots, the Sense HAT and phone manager threads) lives in
+process memory, so more than one worker would give each its own copy and
+fight over the Sense HAT and D-Bus.
+"""
+
+import os
+
+bind = "0.0.0.0:" + os.environ.get("CAR_STEREO_PORT", "5000")
+worker_class = "gthread"
+workers = 1
+# Same default as SERVER_THREADS in backend/app.py
+threads = int(os.environ.get("CAR_STEREO_THREADS", "12"))
+# The UI and the iPhone GPS bridge poll every second or two; keep their
+# connections open between polls instead of reconnecting (default is 2 s)
+keepalive = 5
+
+# backend/ on sys.path too, matching `python backend/app.py`
+pythonpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+
+
+def post_worker_init(worker):
+    """Start background threads inside the worker (not in the master before fork)."""
+    from backend.app import start_background_services
+    start_background_services()